@@ -1,9 +1,97 @@
+import asyncio
+import multiprocessing
+import os
 import time
 import math
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import anyio
+import numpy as np
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 import uvicorn
 
-app = FastAPI()
+# How /io waits, picked per process so each mode runs as its own SUT:
+#   async    await asyncio.sleep on the event loop
+#   thread   sync def handler, FastAPI runs it on its threadpool
+#   backend  await a real socket round trip to an in-process delay server
+IO_MODE = os.environ.get("PYTHON_IO_MODE", "async")
+IO_DELAY = 0.1  # 100ms
+IO_THREADS = int(os.environ.get("PYTHON_IO_THREADS", "0"))  # threadpool size (0 = anyio's default of 40)
+
+# /heavy runs in a pool of worker processes, one per usable core, so it
+# neither holds the GIL nor stalls the event loop (the .NET SUTs Task.Run it).
+# At most HEAVY_QUEUE requests wait for a busy pool; beyond that /heavy sheds
+# load with a 503. PYTHON_HEAVY_WORKERS=0 computes inline on the event loop.
+USABLE_CORES = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+HEAVY_WORKERS = int(os.environ.get("PYTHON_HEAVY_WORKERS", USABLE_CORES))
+HEAVY_QUEUE = int(os.environ.get("PYTHON_HEAVY_QUEUE", 16 * max(HEAVY_WORKERS, 1)))
+
+# The backend: a TCP server that answers every request line after IO_DELAY,
+# like a slow query, and a pool of idle client connections to it
+backend = None
+backend_idle = []
+
+heavy_pool = None
+heavy_ready = None  # set once the pool and the prime table are warm, see warm_up_heavy
+
+# /heavy?n= is accepted up to MAX_N; the table starts with PRIME_TABLE_START primes
+MAX_N = int(os.environ.get("PYTHON_MAX_N", 10_000_000))
+PRIME_TABLE_START = 100_000
+PRIME_TABLE_PATH = os.environ.get("PYTHON_PRIME_TABLE",
+                                  os.path.join(os.path.dirname(os.path.abspath(__file__)), "primes.npy"))
+prime_table = None
+prime_table_lock = None
+heavy_metrics = {"in_flight": 0, "peak_queued": 0, "completed": 0, "rejected": 0, "queue_wait_s": 0.0}
+
+async def delay_server(reader, writer):
+    try:
+        while await reader.readline():
+            await asyncio.sleep(IO_DELAY)
+            writer.write(b"done\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+async def backend_call():
+    if backend_idle:
+        reader, writer = backend_idle.pop()
+    else:
+        reader, writer = await asyncio.open_connection(*backend.sockets[0].getsockname()[:2])
+    try:
+        writer.write(b"query\n")
+        await writer.drain()
+        if not await reader.readline():
+            raise ConnectionError("backend closed the connection")
+    except BaseException:
+        writer.close()
+        raise
+    backend_idle.append((reader, writer))
+
+@asynccontextmanager
+async def lifespan(app):
+    global backend, prime_table_lock, heavy_ready
+    prime_table_lock = asyncio.Lock()
+    heavy_ready = asyncio.Event()
+    if IO_THREADS:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = IO_THREADS
+    if IO_MODE == "backend":
+        backend = await asyncio.start_server(delay_server, "127.0.0.1", 0)
+    verify_prime_engines()
+    warm_up = asyncio.create_task(warm_up_heavy())
+    yield
+    await warm_up
+    if heavy_pool is not None:
+        heavy_pool.shutdown(cancel_futures=True)
+    if backend is not None:
+        for _, writer in backend_idle:
+            writer.close()
+        backend.close()
+
+app = FastAPI(lifespan=lifespan)
 
 def get_nth_prime(n: int) -> int:
     count = 0
@@ -21,26 +109,281 @@ def get_nth_prime(n: int) -> int:
             num += 1
     return num
 
-@app.get("/io")
-async def io_handler():
-    # Simulate I/O delay
-    time.sleep(0.1) # 100ms
+# ---------- segmented sieve ----------
+# The same answer as get_nth_prime without trial division: sieve odd numbers
+# up to an upper bound for the nth prime, one cache-sized segment at a time.
+
+def nth_prime_upper_bound(n: int) -> int:
+    # Rosser (n >= 6) and Dusart's tighter bound for n >= 688383
+    if n < 6:
+        return 13
+    log_n = math.log(n)
+    log_log_n = math.log(log_n)
+    if n >= 688383:
+        return int(n * (log_n + log_log_n - 1 + (log_log_n - 2) / log_n)) + 1
+    return int(n * (log_n + log_log_n)) + 1
+
+def l2_cache_bytes(default=256 * 1024) -> int:
+    base = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        for index in sorted(os.listdir(base)):
+            with open(f"{base}/{index}/level") as f:
+                if f.read().strip() != "2":
+                    continue
+            with open(f"{base}/{index}/size") as f:
+                size = f.read().strip()
+            units = {"K": 1024, "M": 1024 ** 2}
+            return int(size[:-1]) * units[size[-1]] if size[-1] in units else int(size)
+    except (OSError, ValueError):
+        pass
+    return default
+
+# One byte per odd number; half of L2 leaves room for the base primes
+SIEVE_SEGMENT = max(32 * 1024, l2_cache_bytes() // 2)
+
+def primes_up_to(limit: int):
+    # Plain odd-only sieve for the base primes (up to sqrt of the bound)
+    if limit < 2:
+        return np.zeros(0, dtype=np.int64)
+    odd = np.ones((limit + 1) // 2, dtype=bool)    # odd[i] is 2i + 1
+    odd[0] = False
+    for i in range(1, (math.isqrt(limit) + 1) // 2):
+        if odd[i]:
+            p = 2 * i + 1
+            odd[p * p // 2::p] = False
+    return np.concatenate(([2], 2 * np.flatnonzero(odd) + 1))
+
+def sieve_segments(limit: int):
+    """(low, seg) for each segment of odd numbers up to limit; seg[i] is low + 2i.
+
+    seg is reused, so it is only valid until the next segment is produced.
+    """
+    base = primes_up_to(math.isqrt(limit))[1:]    # odd base primes
+    segment = np.empty(SIEVE_SEGMENT, dtype=bool)
+    for low in range(1, limit + 1, 2 * SIEVE_SEGMENT):
+        size = min(SIEVE_SEGMENT, (limit - low) // 2 + 1)
+        seg = segment[:size]
+        seg[:] = True
+        if low == 1:
+            seg[0] = False
+        high = low + 2 * size
+        for p in base[base * base < high].tolist():
+            # First odd multiple of p in the segment, never below p*p
+            start = max(p * p, (low + p - 1) // p * p)
+            if start % 2 == 0:
+                start += p
+            seg[(start - low) // 2::p] = False
+        yield low, seg
+
+def get_nth_prime_sieve(n: int) -> int:
+    if n == 1:
+        return 2
+    limit = nth_prime_upper_bound(n)
+    count = 1                                     # 2
+    for low, seg in sieve_segments(limit):
+        found = int(np.count_nonzero(seg))
+        if count + found >= n:
+            return int(low + 2 * np.flatnonzero(seg)[n - count - 1])
+        count += found
+    raise AssertionError(f"upper bound {limit} is below the {n}th prime")
+
+def first_primes(count: int):
+    """The first count primes as np.uint32 (enough for n up to ~200 million)."""
+    chunks = [np.array([2], dtype=np.uint32)]
+    found = 1
+    for low, seg in sieve_segments(nth_prime_upper_bound(count)):
+        chunks.append((low + 2 * np.flatnonzero(seg)).astype(np.uint32))
+        found += len(chunks[-1])
+        if found >= count:
+            break
+    return np.concatenate(chunks)[:count]
+
+PRIME_ENGINES = {"naive": get_nth_prime, "sieve": get_nth_prime_sieve}
+ALGOS = (*PRIME_ENGINES, "table")   # table: look the answer up, see ensure_prime_table
+
+# ---------- prime table ----------
+# ?algo=table answers from the first N primes as a flat np.uint32 array. It is
+# built once, grown (at least doubled) when a larger n arrives, and kept in an
+# .npy file that later starts, and every serve.py worker, map instead of
+# rebuilding.
+
+def build_prime_table(count: int, path: str) -> int:
+    # Runs in a pool process. Written to a temporary file and renamed, so
+    # readers (other workers included) never map a half-written table.
+    table = first_primes(count)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, table)
+    os.replace(tmp, path)
+    return len(table)
+
+def load_prime_table(path: str):
+    try:
+        return np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+
+async def ensure_prime_table(n: int):
+    """The prime table, grown first if it has fewer than n primes."""
+    global prime_table
+    if prime_table is not None and len(prime_table) >= n:
+        return prime_table
+    async with prime_table_lock:
+        if prime_table is None or len(prime_table) < n:
+            table = load_prime_table(PRIME_TABLE_PATH)    # another worker may have grown it
+            if table is None or len(table) < n:
+                size = min(MAX_N, max(n, PRIME_TABLE_START, 2 * (len(table) if table is not None else 0)))
+                if heavy_pool is None:
+                    build_prime_table(size, PRIME_TABLE_PATH)
+                else:
+                    await asyncio.get_running_loop().run_in_executor(
+                        heavy_pool, build_prime_table, size, PRIME_TABLE_PATH)
+                table = load_prime_table(PRIME_TABLE_PATH)
+            prime_table = table
+    return prime_table
+
+def verify_prime_engines():
+    # The sieve has to agree with trial division before it is timed against it
+    # (raised explicitly rather than asserted, so python -O can't skip it)
+    for n in (1, 2, 3, 5, 6, 10, 100, 1000):
+        if get_nth_prime_sieve(n) != get_nth_prime(n):
+            raise RuntimeError(f"sieve disagrees with trial division at n={n}")
+    if get_nth_prime_sieve(20000) != 224737:
+        raise RuntimeError("sieve disagrees with trial division at n=20000")
+
+def timed_nth_prime(n: int, algo: str = "naive"):
+    # Runs in a pool process; the start time tells how long the job queued.
+    # perf_counter is CLOCK_MONOTONIC, so it compares across processes.
+    started = time.perf_counter()
+    return PRIME_ENGINES[algo](n), started
+
+def start_heavy_pool():
+    # Start every worker up front, then warm each one (imports, first call)
+    # so the first measured /heavy requests don't pay for it. Workers come
+    # from a forkserver with this module preloaded rather than from a plain
+    # fork, so they don't inherit the listening socket or uvicorn's signal
+    # handlers and can't outlive the server holding its port. Blocks until
+    # they are up, so it runs in a thread.
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    pool = ProcessPoolExecutor(HEAVY_WORKERS, mp_context=context)
+    warm = [pool.submit(timed_nth_prime, 1000, algo) for _ in range(HEAVY_WORKERS) for algo in PRIME_ENGINES]
+    for future in warm:
+        future.result()
+    return pool
+
+async def warm_up_heavy():
+    # Runs after startup, so the port is bound and /io answers while the pool
+    # boots and the table loads; a cold start doesn't include them. /heavy
+    # waits on heavy_ready instead, and falls back to inline if this fails.
+    global heavy_pool
+    try:
+        if HEAVY_WORKERS:
+            heavy_pool = await asyncio.to_thread(start_heavy_pool)
+        await ensure_prime_table(PRIME_TABLE_START)
+    except Exception:
+        traceback.print_exc()
+    finally:
+        heavy_ready.set()
+
+async def nth_prime_offloaded(n: int, algo: str):
+    """(prime, seconds queued) from the pool, or None when the queue is full."""
+    m = heavy_metrics
+    queued = max(0, m["in_flight"] - HEAVY_WORKERS + 1)
+    if queued > HEAVY_QUEUE:
+        m["rejected"] += 1
+        return None
+    m["in_flight"] += 1
+    m["peak_queued"] = max(m["peak_queued"], queued)
+    submitted = time.perf_counter()
+    try:
+        prime, started = await asyncio.get_running_loop().run_in_executor(heavy_pool, timed_nth_prime, n, algo)
+    finally:
+        m["in_flight"] -= 1
+    m["completed"] += 1
+    m["queue_wait_s"] += started - submitted
+    return prime, started - submitted
+
+def io_response():
     return {
         "Message": "I/O Operation Complete",
+        "Mode": IO_MODE,
         "Platform": "Python (FastAPI)"
     }
 
+async def io_async():
+    await asyncio.sleep(IO_DELAY)
+    return io_response()
+
+def io_thread():
+    # Blocks a threadpool worker, not the event loop
+    time.sleep(IO_DELAY)
+    return io_response()
+
+async def io_backend():
+    await backend_call()
+    return io_response()
+
+IO_HANDLERS = {"async": io_async, "thread": io_thread, "backend": io_backend}
+if IO_MODE not in IO_HANDLERS:
+    raise ValueError(f"Unknown PYTHON_IO_MODE {IO_MODE!r}; expected one of {', '.join(IO_HANDLERS)}")
+app.get("/io")(IO_HANDLERS[IO_MODE])
+
 @app.get("/heavy")
-async def heavy_handler():
+async def heavy_handler(n: int = 20000, algo: str = "naive"):
+    # ?algo=sieve picks the segmented sieve, ?algo=table the precomputed
+    # table; naive is what every SUT runs
+    if algo not in ALGOS:
+        return JSONResponse(status_code=400, content={
+            "Message": f"Unknown algo {algo!r}; expected one of {', '.join(ALGOS)}",
+            "Platform": "Python (FastAPI)"
+        })
+    if not 1 <= n <= MAX_N:
+        return JSONResponse(status_code=400, content={
+            "Message": f"n must be between 1 and {MAX_N}",
+            "Platform": "Python (FastAPI)"
+        })
     start = time.perf_counter()
-    nth = 20000
-    prime = get_nth_prime(nth)
+    await heavy_ready.wait()
+    nth = n
+    queue_ms = 0.0
+    if algo == "table":
+        prime = int((await ensure_prime_table(nth))[nth - 1])
+    elif heavy_pool is None:
+        prime = PRIME_ENGINES[algo](nth)
+    else:
+        offloaded = await nth_prime_offloaded(nth, algo)
+        if offloaded is None:
+            return JSONResponse(status_code=503, headers={"Retry-After": "1"}, content={
+                "Message": "Prime queue full",
+                "Platform": "Python (FastAPI)"
+            })
+        prime, queued = offloaded
+        queue_ms = queued * 1000
     duration = (time.perf_counter() - start) * 1000
 
     return {
         "Message": f"Found {nth}th prime number",
         "Result": prime,
         "DurationMs": duration,
+        "QueueMs": queue_ms,
+        "Algo": algo,
+        "TableSize": len(prime_table) if prime_table is not None else 0,
+        "Platform": "Python (FastAPI)"
+    }
+
+@app.get("/metrics")
+async def metrics_handler():
+    m = heavy_metrics
+    return {
+        "HeavyWorkers": HEAVY_WORKERS,
+        "HeavyQueueLimit": HEAVY_QUEUE,
+        "InFlight": m["in_flight"],
+        "QueueDepth": max(0, m["in_flight"] - HEAVY_WORKERS),
+        "PeakQueueDepth": m["peak_queued"],
+        "Completed": m["completed"],
+        "Rejected": m["rejected"],
+        "AvgQueueMs": m["queue_wait_s"] / m["completed"] * 1000 if m["completed"] else None,
         "Platform": "Python (FastAPI)"
     }
 
@@ -0,0 +1,147 @@
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+
+# Multi-process launcher for the Python SUT, the way it would be deployed:
+# N uvicorn workers, each pinned to its own core and listening on its own
+# SO_REUSEPORT socket, so the kernel spreads connections across them.
+#
+# The app is imported before forking so every worker shares its pages
+# copy-on-write. The parent supervises the workers and restarts any that die.
+# Per-worker request counts live in shared memory; GET /workers on any worker
+# returns all of them, which shows how evenly the kernel balanced the load.
+#
+#   python serve.py --workers 4 --port 8003
+
+MIN_UPTIME = 1.0        # a worker that exits sooner than this counts as a crash
+MAX_CRASHES = 5         # consecutive crashes before the launcher gives up
+POLL_INTERVAL = 0.1     # seconds between checks on the workers
+STOP_TIMEOUT = 10       # seconds between SIGTERM and SIGKILL on shutdown
+
+
+def parse_args():
+    allowed = sorted(os.sched_getaffinity(0))
+    parser = argparse.ArgumentParser(description="Run the Python SUT as N pinned, supervised workers.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=len(allowed),
+                        help="worker processes (default: one per usable core)")
+    parser.add_argument("--cpus", default=",".join(map(str, allowed)),
+                        help="comma-separated CPU ids the workers are pinned to, round-robin")
+    parser.add_argument("--no-pin", action="store_true", help="let the scheduler place the workers")
+    return parser.parse_args()
+
+
+def listen_socket(host, port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(socket.SOMAXCONN)
+    return sock
+
+
+def counting(app, index, counts):
+    # ASGI wrapper: count this worker's requests and answer /workers
+    async def wrapped(scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/workers":
+            body = json.dumps({"Requests": list(counts), "Platform": "Python (FastAPI)"}).encode()
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": [(b"content-type", b"application/json")]})
+            await send({"type": "http.response.body", "body": body})
+            return
+        if scope["type"] == "http":
+            counts[index] += 1
+        await app(scope, receive, send)
+    return wrapped
+
+
+def run_worker(app, index, cpu, args, counts):
+    if cpu is not None:
+        # Before the event loop and the /heavy pool start, so both inherit it
+        os.sched_setaffinity(0, {cpu})
+    import uvicorn
+    config = uvicorn.Config(counting(app, index, counts), lifespan="on", log_level="warning")
+    uvicorn.Server(config).run(sockets=[listen_socket(args.host, args.port)])
+
+
+def main():
+    args = parse_args()
+    cpus = [int(c) for c in args.cpus.split(",") if c.strip()]
+    # Pinned to one core, each worker gets a single /heavy process on that core
+    if not args.no_pin:
+        os.environ.setdefault("PYTHON_HEAVY_WORKERS", "1")
+
+    from main import app    # preload before fork
+    counts = multiprocessing.Array("Q", args.workers, lock=False)
+    workers = {}            # pid -> (index, started)
+    stopping = False
+
+    def spawn(index):
+        cpu = None if args.no_pin else cpus[index % len(cpus)]
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)   # uvicorn installs its own
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                run_worker(app, index, cpu, args, counts)
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+            finally:
+                os._exit(code)
+        workers[pid] = (index, time.monotonic())
+        print(f"worker {index} pid {pid}" + (f" on cpu {cpu}" if cpu is not None else ""), flush=True)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for index in range(args.workers):
+        spawn(index)
+
+    crashes = 0
+    deadline = None
+    while workers:
+        if stopping and deadline is None:
+            deadline = time.monotonic() + STOP_TIMEOUT
+        if deadline is not None and time.monotonic() > deadline:
+            for pid in workers:
+                os.kill(pid, signal.SIGKILL)
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid == 0:
+            time.sleep(POLL_INTERVAL)
+            continue
+        index, started = workers.pop(pid)
+        if stopping:
+            continue
+        print(f"worker {index} pid {pid} exited ({os.waitstatus_to_exitcode(status)})", flush=True)
+        crashes = crashes + 1 if time.monotonic() - started < MIN_UPTIME else 0
+        if crashes >= MAX_CRASHES:
+            print(f"{crashes} workers crashed on startup in a row; giving up", flush=True)
+            stop(None, None)
+            continue
+        spawn(index)
+
+    total = sum(counts)
+    print("requests per worker: " + ", ".join(
+        f"{i}={c} ({c / total:.0%})" if total else f"{i}={c}" for i, c in enumerate(counts)), flush=True)
+    sys.exit(1 if crashes >= MAX_CRASHES else 0)
+
+
+if __name__ == "__main__":
+    main()
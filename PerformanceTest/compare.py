@@ -0,0 +1,311 @@
+import argparse
+import json
+import math
+import numpy as np
+import os
+import sys
+import time
+import store
+
+# Regression gate: compares one run against a baseline, per round and SUT,
+# and exits non-zero when a metric got worse by more than its noise allows.
+#
+#   python3 compare.py                       # latest run vs pinned baseline (or the previous run)
+#   python3 compare.py latest 20260101-...   # any two stored runs or results.json files
+#   python3 compare.py --pin latest          # pin the latest run as the baseline
+
+# ================= CONFIG =================
+
+RESULTS_DB = "results.db"
+REPORT_FILE = "compare.html"
+TOLERANCE = 0.05        # relative change always tolerated (5%)
+ERROR_TOLERANCE = 0.005 # absolute increase in error rate tolerated
+NOISE_K = 3.0           # historical spread: tolerate NOISE_K standard deviations
+HISTORY_RUNS = 20       # stored runs on the same setup used to estimate spread
+Z = 1.96                # confidence for percentile bounds from histograms
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+# Metrics compared and which direction is worse
+HIGHER_IS_WORSE = ["avg"] + [f"p{q:g}" for q in PERCENTILES]
+LOWER_IS_WORSE = ["throughput", "goodput"]
+
+# ================= LOADING =================
+
+def resolve(ref, db, baseline_name):
+    """(label, info, results) for a run id, latest, previous, baseline or a results.json path."""
+    if ref.endswith(".json") and os.path.exists(ref):
+        return ref, None, store.load_results_file(ref)
+    if not os.path.exists(db):
+        sys.exit(f"No results database at {db}; run load_test.py first or pass results.json files")
+
+    if ref in ("latest", "previous"):
+        runs = store.recent_runs(db, 2)
+        if len(runs) < (1 if ref == "latest" else 2):
+            sys.exit(f"Not enough stored runs in {db} for {ref!r}")
+        run_id = runs[-1][0] if ref == "latest" else runs[0][0]
+    elif ref == "baseline":
+        run_id = store.baseline_run(db, baseline_name)
+        if run_id is None:
+            sys.exit(f"No baseline pinned under {baseline_name!r}; use --pin RUN")
+    else:
+        run_id = ref
+
+    info = store.run_info(db, run_id)
+    if info is None:
+        sys.exit(f"No stored run {run_id!r} in {db}")
+    return run_id, info, store.load_run(db, run_id)
+
+# ================= METRICS =================
+
+def metric_values(summary):
+    # Percentiles come from the histogram when there is one, so any
+    # percentile can be recomputed exactly rather than only the stored ones
+    hist = summary.get("histogram")
+    exact = hist is not None and len(hist) > 0
+    values = {
+        "throughput": summary.get("throughput"),
+        "goodput": summary.get("goodput"),
+        "avg": hist.mean() if exact else summary.get("avg"),
+    }
+    for q in PERCENTILES:
+        key = f"p{q:g}"
+        values[key] = hist.percentile(q) if exact else summary.get(key)
+    sent = summary.get("sent") or (summary.get("count", 0) + summary.get("errors", 0))
+    values["error_rate"] = summary.get("errors", 0) / sent if sent else None
+    return values
+
+def percentile_noise(summary, q):
+    # Relative half-width of the order-statistic confidence interval around
+    # the q-th percentile: how much it could move from sampling alone
+    hist = summary.get("histogram")
+    if hist is None or not len(hist):
+        return 0.0
+    n = len(hist)
+    p = q / 100
+    spread = Z * math.sqrt(n * p * (1 - p))
+    lo = hist.percentile(max(1, n * p - spread) / n * 100)
+    hi = hist.percentile(min(n, n * p + spread) / n * 100)
+    value = hist.percentile(q)
+    return (hi - lo) / 2 / value if value else 0.0
+
+def trial_noise(summary, metric):
+    # Repeated-trial rounds carry their own confidence intervals
+    trial = (summary.get("trials") or {}).get("metrics", {}).get(metric)
+    if not trial or trial["half_width"] is None or math.isinf(trial["half_width"]):
+        return 0.0
+    return trial["half_width"]
+
+def history_noise(db, info, test, sut, metric):
+    # Coefficient of variation over earlier runs on the same setup
+    if info is None or metric not in store.METRICS or not os.path.exists(db):
+        return 0.0
+    rows = store.history(db, sut, test, metric, HISTORY_RUNS,
+                         fingerprint=info["fingerprint"], before=info["started_at"])
+    values = np.array([row[3] for row in rows if row[3] is not None], dtype=float)
+    if len(values) < 3 or not values.mean():
+        return 0.0
+    return float(values.std(ddof=1) / abs(values.mean()))
+
+def threshold(db, cur, base, cur_info, test, sut, metric, tolerance):
+    noise = trial_noise(cur, metric) + trial_noise(base, metric)
+    if metric.startswith("p"):
+        q = float(metric[1:])
+        noise = max(noise, percentile_noise(cur, q) + percentile_noise(base, q))
+    noise = max(noise, NOISE_K * history_noise(db, cur_info, test, sut, metric))
+    return max(tolerance, noise)
+
+def compare_pair(db, cur, base, cur_info, test, sut, tolerance=TOLERANCE):
+    rows = []
+    cur_values = metric_values(cur)
+    base_values = metric_values(base)
+    for metric in LOWER_IS_WORSE + HIGHER_IS_WORSE:
+        a, b = cur_values[metric], base_values[metric]
+        if a is None or b is None or not b:
+            continue
+        delta = (a - b) / b
+        limit = threshold(db, cur, base, cur_info, test, sut, metric, tolerance)
+        worse = delta < 0 if metric in LOWER_IS_WORSE else delta > 0
+        if abs(delta) <= limit:
+            status = "ok"
+        else:
+            status = "regression" if worse else "improvement"
+        rows.append({"metric": metric, "baseline": b, "current": a, "delta": delta,
+                     "threshold": limit, "status": status})
+
+    a, b = cur_values["error_rate"], base_values["error_rate"]
+    if a is not None and b is not None:
+        delta = a - b
+        status = "ok" if abs(delta) <= ERROR_TOLERANCE else ("regression" if delta > 0 else "improvement")
+        rows.append({"metric": "error_rate", "baseline": b, "current": a, "delta": delta,
+                     "threshold": ERROR_TOLERANCE, "status": status, "absolute": True})
+    return rows
+
+def compare_runs(db, current, baseline, cur_info, tolerance=TOLERANCE):
+    """{(round, sut): rows} for every pair present in both runs, plus what is missing."""
+    diffs = {}
+    missing = []
+    for test, data in current.items():
+        for sut, cur in data.items():
+            base = baseline.get(test, {}).get(sut)
+            if base is None:
+                missing.append(f"{test}/{sut} not in baseline")
+            elif "count" in cur and "count" in base:
+                diffs[(test, sut)] = compare_pair(db, cur, base, cur_info, test, sut, tolerance)
+    for test, data in baseline.items():
+        for sut in data:
+            if sut not in current.get(test, {}):
+                missing.append(f"{test}/{sut} not in current run")
+    return diffs, missing
+
+# ================= OUTPUT =================
+
+STATUS_ICON = {"ok": "  ", "regression": "🔴", "improvement": "🟢"}
+
+def fmt_value(metric, value):
+    if metric in LOWER_IS_WORSE:
+        return f"{value:,.1f}/s"
+    if metric == "error_rate":
+        return f"{value:.2%}"
+    return f"{value * 1000:.2f}ms"
+
+def fmt_delta(row):
+    return f"{row['delta']:+.2%}" if row.get("absolute") else f"{row['delta']:+.1%} (±{row['threshold']:.1%})"
+
+def print_diff(diffs, missing):
+    for (test, sut), rows in diffs.items():
+        print(f"\n{test} / {sut}")
+        for row in rows:
+            print(f"  {STATUS_ICON[row['status']]} {row['metric']:<11} {fmt_value(row['metric'], row['baseline']):>12} → "
+                  f"{fmt_value(row['metric'], row['current']):>12}  {fmt_delta(row)}")
+    for line in missing:
+        print(f"  ⚠️  {line}")
+
+def write_report(path, diffs, missing, cur_label, base_label, notes):
+    colors = {"ok": "var(--text-dim)", "regression": "#ef4444", "improvement": "#4ade80"}
+    cards = ""
+    for (test, sut), rows in diffs.items():
+        body = "".join(
+            f"<tr><td class=\"stat-label\">{row['metric']}</td>"
+            f"<td>{fmt_value(row['metric'], row['baseline'])}</td>"
+            f"<td>{fmt_value(row['metric'], row['current'])}</td>"
+            f"<td style=\"color: {colors[row['status']]}\">{fmt_delta(row)}</td></tr>"
+            for row in rows)
+        regressions = sum(row["status"] == "regression" for row in rows)
+        cards += f"""
+        <div class="card">
+            <h2>{test} / {sut} {'🔴' if regressions else '✅'}</h2>
+            <table class="diff-table">
+                <tr><th>Metric</th><th>Baseline</th><th>Current</th><th>Δ (threshold)</th></tr>
+                {body}
+            </table>
+        </div>"""
+    notes_html = "".join(f"<li>{line}</li>" for line in notes + missing)
+
+    html = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Performance Comparison</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;800&display=swap" rel="stylesheet">
+    <style>
+        :root {{ --primary: #3b82f6; --bg: #0f172a; --card-bg: #1e293b; --text: #f8fafc; --text-dim: #94a3b8; }}
+        body {{ font-family: 'Inter', sans-serif; background: var(--bg); color: var(--text); margin: 0; padding: 40px 20px; }}
+        .container {{ max-width: 1200px; margin: auto; }}
+        h1 {{ text-align: center; font-weight: 800; font-size: 2rem; margin-bottom: 10px; }}
+        .subtitle {{ text-align: center; color: var(--text-dim); margin-bottom: 30px; }}
+        .grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(450px, 1fr)); gap: 30px; }}
+        .card {{ background: var(--card-bg); padding: 25px; border-radius: 16px; border: 1px solid rgba(255,255,255,0.05); }}
+        h2 {{ margin-top: 0; font-size: 1.2rem; color: var(--primary); }}
+        .stat-label {{ color: var(--text-dim); }}
+        .diff-table {{ width: 100%; border-collapse: collapse; font-size: 0.85rem; }}
+        .diff-table th, .diff-table td {{ padding: 6px; text-align: right; border-bottom: 1px solid rgba(255,255,255,0.05); }}
+        .diff-table th:first-child, .diff-table td:first-child {{ text-align: left; }}
+        .diff-table th {{ color: var(--text-dim); font-weight: 600; }}
+        ul {{ color: var(--text-dim); }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📊 {cur_label} vs {base_label}</h1>
+        <div class="subtitle">Generated {time.strftime('%Y-%m-%d %H:%M')}</div>
+        <ul>{notes_html}</ul>
+        <div class="grid">
+            {cards}
+        </div>
+    </div>
+</body>
+</html>
+"""
+    with open(path, "w") as f:
+        f.write(html)
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare a benchmark run against a baseline.")
+    parser.add_argument("current", nargs="?", default="latest",
+                        help="run id, 'latest', 'previous' or a results.json path (default: latest)")
+    parser.add_argument("baseline", nargs="?",
+                        help="run id, 'baseline', 'previous' or a results.json path "
+                             "(default: the pinned baseline, else the previous run)")
+    parser.add_argument("--db", default=RESULTS_DB, help=f"results database (default: {RESULTS_DB})")
+    parser.add_argument("--name", default="default", help="name of the pinned baseline")
+    parser.add_argument("--pin", metavar="RUN", help="pin RUN (id or 'latest') as the baseline and exit")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"relative change always tolerated (default: {TOLERANCE})")
+    parser.add_argument("--report", default=REPORT_FILE, help=f"diff report path (default: {REPORT_FILE})")
+    parser.add_argument("--json", metavar="PATH", help="also write the comparison as JSON")
+    args = parser.parse_args(argv)
+
+    if args.pin:
+        run_id, _, _ = resolve(args.pin, args.db, args.name)
+        store.pin_baseline(args.db, run_id, args.name)
+        print(f"📌 Pinned {run_id} as baseline {args.name!r}")
+        return 0
+
+    baseline_ref = args.baseline
+    if baseline_ref is None:
+        pinned = os.path.exists(args.db) and store.baseline_run(args.db, args.name)
+        baseline_ref = "baseline" if pinned else "previous"
+
+    cur_label, cur_info, current = resolve(args.current, args.db, args.name)
+    base_label, base_info, baseline = resolve(baseline_ref, args.db, args.name)
+    if cur_label == base_label:
+        sys.exit(f"Both sides resolve to {cur_label}; pass two different runs")
+
+    notes = []
+    if cur_info and base_info:
+        if cur_info["fingerprint"] != base_info["fingerprint"]:
+            changed = sorted(k for k in set(cur_info["environment"]) | set(base_info["environment"])
+                             if k != "host" and cur_info["environment"].get(k) != base_info["environment"].get(k))
+            notes.append(f"Environment differs: {', '.join(changed)}")
+        notes.append(f"Revisions: {(base_info['git_rev'] or '?')[:10]} → {(cur_info['git_rev'] or '?')[:10]}")
+
+    print(f"🔍 Comparing {cur_label} against {base_label}")
+    for note in notes:
+        print(f"  ℹ️  {note}")
+    diffs, missing = compare_runs(args.db, current, baseline, cur_info, args.tolerance)
+    print_diff(diffs, missing)
+
+    write_report(args.report, diffs, missing, cur_label, base_label, notes)
+    print(f"\n📄 Diff report → {args.report}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"current": cur_label, "baseline": base_label, "notes": notes, "missing": missing,
+                       "diffs": [{"round": test, "sut": sut, "rows": rows} for (test, sut), rows in diffs.items()]},
+                      f, indent=2)
+
+    regressions = [(test, sut, row["metric"]) for (test, sut), rows in diffs.items()
+                   for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond tolerance:")
+        for test, sut, metric in regressions:
+            print(f"   {test}/{sut}: {metric}")
+        return 1
+    print("\n✅ No regressions beyond tolerance")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import asyncio
+import errno
+
+# Fixed taxonomy of request failures. Each class points at a different
+# bottleneck: refused connections mean the accept queue is full, connect
+# timeouts a SYN backlog that isn't drained, read timeouts a server that
+# accepted work it can't finish, resets a server shedding connections, and
+# 429/5xx a server that is still answering but refusing the work.
+
+ERROR_CLASSES = (
+    "connect_refused",  # ECONNREFUSED: nothing listening, or the backlog is full
+    "connect_timeout",  # no TCP connection within the timeout
+    "connect_error",    # any other failure to connect (DNS, unreachable, ...)
+    "pool_timeout",     # timed out waiting for a free pooled connection (client-side)
+    "read_timeout",     # request sent, response not complete within the timeout
+    "reset",            # connection reset or closed mid-request
+    "http_429",
+    "http_5xx",
+    "http_4xx",
+    "http_other",       # any other non-200 status
+    "other",
+)
+
+RESET_ERRNOS = {errno.ECONNRESET, errno.EPIPE, errno.ECONNABORTED}
+
+
+def classify_status(status):
+    if status == 429:
+        return "http_429"
+    if 500 <= status < 600:
+        return "http_5xx"
+    if 400 <= status < 500:
+        return "http_4xx"
+    return "http_other"
+
+
+def _chain(exc):
+    # The exception, what it wraps (requests/urllib3 nest theirs several levels
+    # deep in args and .reason) and what caused it
+    seen = []
+    pending = [exc]
+    while pending:
+        e = pending.pop()
+        if e is None or not isinstance(e, BaseException) or any(e is s for s in seen):
+            continue
+        seen.append(e)
+        pending.extend([e.__cause__, e.__context__, getattr(e, "reason", None),
+                        getattr(e, "os_error", None), *e.args])
+    return seen
+
+
+def classify_exception(exc, sent=None, queued=False):
+    """Error class of a failed request.
+
+    sent and queued come from the request's trace when known: a timeout after
+    the request went out is a read timeout, one while still queued for a
+    pooled connection is the client's own bottleneck.
+    """
+    chain = _chain(exc)
+    names = {type(e).__name__ for e in chain}
+
+    # requests / urllib3 say which phase timed out
+    if names & {"ConnectTimeout", "ConnectTimeoutError"}:
+        return "connect_timeout"
+    if names & {"ReadTimeout", "ReadTimeoutError"}:
+        return "read_timeout"
+
+    for e in chain:
+        if isinstance(e, ConnectionRefusedError) or getattr(e, "errno", None) == errno.ECONNREFUSED:
+            return "connect_refused"
+        if isinstance(e, ConnectionResetError) or getattr(e, "errno", None) in RESET_ERRNOS:
+            return "reset"
+
+    if names & {"ServerDisconnectedError", "ClientPayloadError", "RemoteDisconnected",
+                "ProtocolError", "ChunkedEncodingError"}:
+        return "reset"
+    if "ConnectionTimeoutError" in names:  # aiohttp's connect/sock_connect timeout
+        return "connect_timeout"
+    if "SocketTimeoutError" in names:      # aiohttp's sock_read timeout
+        return "read_timeout"
+    if any(isinstance(e, (asyncio.TimeoutError, TimeoutError)) for e in chain):
+        if queued:
+            return "pool_timeout"
+        return "read_timeout" if sent else "connect_timeout"
+    if names & {"ClientConnectorError", "ClientConnectorDNSError", "NewConnectionError", "ConnectionError"}:
+        return "connect_error"
+    return "other"
@@ -0,0 +1,163 @@
+import numpy as np
+import struct
+import zlib
+
+# Log-linear latency histogram with HdrHistogram bucket semantics.
+#
+# Values are recorded as integers in a fixed unit (microseconds by default)
+# into a counts array whose size depends only on the trackable range and the
+# number of significant digits, so memory stays constant no matter how many
+# requests a round sends. Every recorded value is kept to within
+# 10^-significant_digits relative error.
+
+UNITS = {"us": 1e-6, "ns": 1e-9}
+
+# Serialized form: this header, then the zlib-compressed indices (uint32) and
+# counts (int64) of the non-empty buckets.
+HEADER = struct.Struct("<4sBB2sqqqqqq")
+MAGIC = b"HIST"
+VERSION = 1
+
+
+class LatencyHistogram:
+    def __init__(self, highest=3600, significant_digits=3, unit="us"):
+        """highest: largest trackable latency in seconds (larger values are clamped)."""
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        if unit not in UNITS:
+            raise ValueError(f"Unknown unit: {unit}")
+
+        self.unit = unit
+        self.significant_digits = significant_digits
+        self.scale = UNITS[unit]
+        self.highest_trackable = max(2, int(highest / self.scale))
+
+        single_unit_range = 2 * 10 ** significant_digits
+        self.sub_bucket_count_magnitude = (single_unit_range - 1).bit_length()
+        self.sub_bucket_half_count_magnitude = self.sub_bucket_count_magnitude - 1
+        self.sub_bucket_count = 1 << self.sub_bucket_count_magnitude
+        self.sub_bucket_half_count = self.sub_bucket_count >> 1
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        bucket_count = 1
+        smallest_untrackable = self.sub_bucket_count
+        while smallest_untrackable <= self.highest_trackable:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self.bucket_count = bucket_count
+
+        self.counts = np.zeros((bucket_count + 1) * self.sub_bucket_half_count, dtype=np.int64)
+        self.total_count = 0
+        self.total = 0
+        self.min_value = None
+        self.max_value = 0
+
+    # ---------- recording ----------
+
+    def _index(self, value):
+        bucket_index = (value | self.sub_bucket_mask).bit_length() - self.sub_bucket_count_magnitude
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + sub_bucket_index - self.sub_bucket_half_count
+
+    def record_value(self, value, count=1):
+        """Record an integer value in the histogram's unit."""
+        value = min(max(int(value), 0), self.highest_trackable)
+        self.counts[self._index(value)] += count
+        self.total_count += count
+        self.total += value * count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+    def record(self, seconds, count=1):
+        self.record_value(round(seconds / self.scale), count)
+
+    def merge(self, other):
+        if (other.unit, other.significant_digits) != (self.unit, self.significant_digits):
+            raise ValueError("Cannot merge histograms with different unit or precision")
+        if len(other.counts) > len(self.counts):
+            grown = np.zeros_like(other.counts)
+            grown[:len(self.counts)] = self.counts
+            self.counts = grown
+            self.bucket_count = other.bucket_count
+            self.highest_trackable = other.highest_trackable
+        self.counts[:len(other.counts)] += other.counts
+        self.total_count += other.total_count
+        self.total += other.total
+        if other.min_value is not None and (self.min_value is None or other.min_value < self.min_value):
+            self.min_value = other.min_value
+        self.max_value = max(self.max_value, other.max_value)
+        return self
+
+    def reset(self):
+        self.counts[:] = 0
+        self.total_count = 0
+        self.total = 0
+        self.min_value = None
+        self.max_value = 0
+
+    # ---------- queries ----------
+
+    def _highest_equivalent(self, index):
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+        lowest = sub_bucket_index << bucket_index
+        return lowest + (1 << bucket_index) - 1
+
+    def value_at_percentile(self, percentile):
+        """Integer value (in the histogram's unit) at the given percentile."""
+        if self.total_count == 0:
+            return None
+        target = max(1, int(min(percentile, 100.0) / 100.0 * self.total_count + 0.5))
+        index = int(np.searchsorted(np.cumsum(self.counts), target))
+        return min(self._highest_equivalent(index), self.max_value)
+
+    def percentile(self, percentile):
+        value = self.value_at_percentile(percentile)
+        return None if value is None else value * self.scale
+
+    def mean(self):
+        return self.total / self.total_count * self.scale if self.total_count else None
+
+    def max(self):
+        return self.max_value * self.scale if self.total_count else None
+
+    def min(self):
+        return self.min_value * self.scale if self.total_count else None
+
+    def __len__(self):
+        return self.total_count
+
+    # ---------- serialization ----------
+
+    def to_bytes(self):
+        indices = np.flatnonzero(self.counts).astype(np.uint32)
+        payload = zlib.compress(indices.tobytes() + self.counts[indices].tobytes())
+        header = HEADER.pack(MAGIC, VERSION, self.significant_digits, self.unit.encode(),
+                             self.highest_trackable, len(self.counts), self.total_count, self.total,
+                             -1 if self.min_value is None else self.min_value, self.max_value)
+        return header + payload
+
+    @classmethod
+    def from_bytes(cls, data):
+        (magic, version, digits, unit, highest, length, total_count, total,
+         min_value, max_value) = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a serialized LatencyHistogram")
+        unit = unit.decode()
+        hist = cls(highest=highest * UNITS[unit], significant_digits=digits, unit=unit)
+        hist.highest_trackable = highest
+        hist.counts = np.zeros(length, dtype=np.int64)
+        payload = zlib.decompress(data[HEADER.size:])
+        n = len(payload) // 12
+        indices = np.frombuffer(payload[:4 * n], dtype=np.uint32)
+        hist.counts[indices] = np.frombuffer(payload[4 * n:], dtype=np.int64)
+        hist.total_count = total_count
+        hist.total = total
+        hist.min_value = None if min_value < 0 else min_value
+        hist.max_value = max_value
+        return hist
@@ -2,9 +2,12 @@ import requests
 import threading
 import time
 import json
-import statistics
 import sys
 import random
+from collections import defaultdict
+from errors import classify_exception, classify_status
+from histogram import LatencyHistogram
+from validation import JsonFields
 
 # Configuration
 NODE_BASE = "http://localhost:3000"
@@ -14,6 +17,8 @@ DOTNET_BASE = "http://localhost:5500"
 CPU_CONCURRENCY = 200
 CPU_REQUESTS = 25 
 EXPECTED_PRIME = 224737
+# Go, .NET and Python answer "Result", Node "result"; keys are normalized
+PRIME_VALIDATOR = JsonFields(expect={"result": EXPECTED_PRIME})
 
 # I/O TEST CONFIG
 IO_CONCURRENCY = 1000
@@ -31,22 +36,35 @@ BREAKING_REQUESTS = 5  # Quick burst to test stability
 
 results = {
     "CPU": {
-        "Node.js": {"times": [], "errors": 0, "mismatches": 0},
-        "Dotnet": {"times": [], "errors": 0, "mismatches": 0}
+        "Node.js": {"times": LatencyHistogram(), "errors": 0, "failures": {}, "mismatches": 0},
+        "Dotnet": {"times": LatencyHistogram(), "errors": 0, "failures": {}, "mismatches": 0}
     },
     "IO": {
-        "Node.js": {"times": [], "errors": 0},
-        "Dotnet": {"times": [], "errors": 0}
+        "Node.js": {"times": LatencyHistogram(), "errors": 0, "failures": {}},
+        "Dotnet": {"times": LatencyHistogram(), "errors": 0, "failures": {}}
     },
     "Attack": {
-        "Node.js": {"times": [], "errors": 0},
-        "Dotnet": {"times": [], "errors": 0}
+        "Node.js": {"times": LatencyHistogram(), "errors": 0, "failures": {}},
+        "Dotnet": {"times": LatencyHistogram(), "errors": 0, "failures": {}}
     },
     "Breaking": {
         "Node.js": {"max_concurrency": 0},
         "Dotnet": {"max_concurrency": 0}
     }
 }
+results_lock = threading.Lock()
+
+
+def record_failure(category, platform, kind, elapsed):
+    # One failed request: total count plus a time-to-failure histogram per error class
+    entry = results[category][platform]
+    with results_lock:
+        entry["errors"] += 1
+        entry["failures"].setdefault(kind, LatencyHistogram()).record(elapsed)
+
+
+def describe_failures(failures):
+    return ", ".join(f"{kind}={len(hist)} (ttf p50 {hist.percentile(50):.3f}s)" for kind, hist in failures.items())
 
 
 def cool_down(seconds=5):
@@ -74,6 +92,7 @@ def find_breaking_point(url, platform):
         
         # Reset errors for this batch
         local_errors = 0
+        local_failures = defaultdict(int)
         total_reqs = current_concurrency * BREAKING_REQUESTS
         completed_count = 0
         completed_lock = threading.Lock()
@@ -89,9 +108,11 @@ def find_breaking_point(url, platform):
                     if resp.status_code != 200:
                         with completed_lock:
                             local_errors += 1
-                except:
+                            local_failures[classify_status(resp.status_code)] += 1
+                except Exception as exc:
                     with completed_lock:
                         local_errors += 1
+                        local_failures[classify_exception(exc)] += 1
                 
                 with completed_lock:
                     completed_count += 1
@@ -108,7 +129,8 @@ def find_breaking_point(url, platform):
         for t in threads:
             t.join()
             
-        print(f"Errors: {local_errors}/{total_reqs}")
+        breakdown = ", ".join(f"{kind}={n}" for kind, n in local_failures.items())
+        print(f"Errors: {local_errors}/{total_reqs}" + (f" ({breakdown})" if breakdown else ""))
         
         # Check logic: > 10 errors OR > 1% failure rate is considered "Broken"
         if local_errors > 10:
@@ -155,16 +177,16 @@ def run_load(url, platform, category, concurrency, requests_per_thread, check_pr
                 resp = session.get(url, timeout=30)
                 if resp.status_code == 200:
                     duration = time.time() - start
-                    results[category][platform]["times"].append(duration)
+                    with completed_lock:
+                        results[category][platform]["times"].record(duration)
                     
-                    if check_prime:
-                        data = resp.json()
-                        if data.get("result") != EXPECTED_PRIME:
+                    if check_prime and PRIME_VALIDATOR.check(resp.content) is not None:
+                        with completed_lock:
                             results[category][platform]["mismatches"] += 1
                 else:
-                    results[category][platform]["errors"] += 1
-            except Exception:
-                results[category][platform]["errors"] += 1
+                    record_failure(category, platform, classify_status(resp.status_code), time.time() - start)
+            except Exception as exc:
+                record_failure(category, platform, classify_exception(exc), time.time() - start)
             
             with completed_lock:
                 completed_count += 1
@@ -209,11 +231,14 @@ def run_load(url, platform, category, concurrency, requests_per_thread, check_pr
     # Final print to clear line
     sys.stdout.write(f'\r[{category}] {platform} |{"█"*30}| 100.0% ({total_requests}/{total_requests}) ✅\n')
     sys.stdout.flush()
+    failures = results[category][platform]["failures"]
+    if failures:
+        print(f"   ⚠️  Errors: {describe_failures(failures)}")
 
 def generate_html_report():
     def get_avg(cat, plat):
         data = results[cat][plat]["times"]
-        return statistics.mean(data) if data else 0
+        return data.mean() if data else 0
 
     def get_errors(cat, plat):
         return results[cat][plat]["errors"]
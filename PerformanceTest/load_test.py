@@ -1,9 +1,26 @@
 import asyncio
 import aiohttp
-import time
+import json
+import multiprocessing
 import numpy as np
+import os
+import random
+import time
+from types import SimpleNamespace
+from urllib.parse import urlparse
 from collections import defaultdict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from errors import ERROR_CLASSES, classify_exception, classify_status
 from tqdm import tqdm
+from histogram import LatencyHistogram
+from orchestrator import SUT_CPUS, SutNotReady, SutProcess, build_all
+from phases import PHASES, PhaseTimings, split_sides
+from resources import ResourceSampler, pid_for_port, resource_series, resource_usage, tree_rss
+import store
+from timeseries import IntervalRecorder, series_to_columns
+from trials import bootstrap_ci, permutation_test, relative_half_width
+from validation import JsonFields, normalize_keys
 
 # ================= CONFIG =================
 
@@ -11,26 +28,149 @@ NODE = "http://localhost:3000"
 DOTNET = "http://localhost:5500"
 GO = "http://localhost:8080"
 DOTNET_AOT = "http://localhost:5600"
-PYTHON = "http://localhost:8000"
+PYTHON = "http://localhost:8000"              # PYTHON_IO_MODE=async
+PYTHON_THREAD = "http://localhost:8001"       # PYTHON_IO_MODE=thread
+PYTHON_BACKEND = "http://localhost:8002"      # PYTHON_IO_MODE=backend
+PYTHON_WORKERS = "http://localhost:8003"      # serve.py, one worker per core
 
 
 TEST_DURATION = 30      # seconds per test
 WARMUP_DURATION = 5
+SERIES_INTERVAL = 1.0   # seconds per window of the per-round time series
+CONTROL_INTERVAL = 0.1  # seconds between load-profile adjustments
+RESOURCE_INTERVAL = 0.25  # seconds between /proc samples of the SUT (None to disable)
+SUT_WORKERS_PATH = "/workers"  # per-worker request counts of multi-worker SUTs (PythonTest/serve.py)
+ARRIVAL = "poisson"     # open-loop inter-arrival times: "uniform" or "poisson"
+IO_RATE = 500           # target requests/s for the open-loop IO round
+CPU_RATE = 10           # target requests/s for the open-loop CPU round
+
+# Traffic shape for the staged round. A (start, end) pair ramps linearly over
+# the stage; use "rate" instead of "users" in every stage for open-loop arrivals.
+LOAD_PROFILE = [
+    {"name": "ramp", "duration": 30, "users": (0, 500)},
+    {"name": "plateau", "duration": 60, "users": 500},
+    {"name": "spike", "duration": 10, "users": 2000},
+    {"name": "recovery", "duration": 30, "users": 500},
+]
+MANAGE_SUTS = False     # launch each SUT with orchestrator.py, one at a time (see USAGE.md)
+LOAD_WORKERS = None     # load-generator processes per round (None = one per spare core)
+WORKER_START_DELAY = 1.0  # seconds for worker processes to boot before a sharded round starts
+COLD_START_REPEATS = 5  # fresh launches per SUT in the cold-start round (needs MANAGE_SUTS)
+COLD_START_REQUESTS = 100 # sequential /io requests timed right after each launch
+COLD_START_SETTLE = 2   # seconds idle before reading the SUT's resident memory
+# Problem-size sweep: single-user /heavy?n=&algo= across orders of magnitude,
+# for SUTs that honour n (the others always compute the 20000th prime). Each
+# point sends up to `requests` requests within `budget` seconds; an algorithm
+# whose median passes `max_median` skips the larger n.
+SCALING = {
+    "ns": [10, 100, 1_000, 10_000, 100_000, 1_000_000],
+    "algos": ["naive", "sieve", "table"],
+    "requests": 10,
+    "budget": 10.0,
+    "max_median": 2.0,
+    "timeout": 120,
+}
 TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Response validation per endpoint path. A VALIDATION_SAMPLE fraction of HTTP
+# 200 responses is kept and checked after the measurement window, so parsing
+# never adds to the measured latency; wrong answers are counted apart from
+# transport errors.
+EXPECTED_PRIME = 224737 # the 20000th prime, what /heavy must return
+# /heavy?algo= per SUT for the CPUBest round; SUTs not listed get plain /heavy
+# (Node routes on the exact URL and would 404 on a query string)
+BEST_PRIME_ALGO = {
+    "Python": "sieve",
+    "Python (thread)": "sieve",
+    "Python (backend)": "sieve",
+    "Python (workers)": "sieve",
+}
+VALIDATORS = {
+    "/heavy": JsonFields(expect={"result": EXPECTED_PRIME}, types={"message": str}),
+    "/io": JsonFields(types={"message": str}),
+}
+VALIDATION_SAMPLE = 0.1 # fraction of HTTP 200 responses validated (0 disables, 1 checks every one)
+
+# Capacity search: grow the load exponentially until a probe fails, then
+# bisect between the last passing and first failing level.
+SEARCH = {
+    "kind": "users",        # "users" (closed-loop) or "rate" (open-loop req/s)
+    "start": 100,
+    "growth": 2.0,
+    "limit": 50000,
+    "resolution": 0.05,     # stop once the bracket is within 5% of the failing level
+    "step_duration": 10,    # seconds per probe
+    "pause": 2,             # seconds between probes
+    "max_error_rate": 0.01, # a probe fails above this fraction of errors...
+    "p99_slo": 1.0,         # ...or above this p99 in seconds (None to ignore latency)
+}
+
+# Rate sweep: open-loop target rates (req/s) per endpoint and the p99 SLO
+# (seconds) that defines each SUT's "max throughput at SLO".
+SWEEP = {
+    "SweepIO": {"path": "/io", "rates": [100, 250, 500, 1000, 2000, 4000, 8000], "p99_slo": 0.25},
+    "SweepCPU": {"path": "/heavy", "rates": [2, 5, 10, 20, 50, 100, 200], "p99_slo": 2.0},
+}
+SWEEP_STEP_DURATION = 15  # seconds per rate
+SWEEP_MIN_ACHIEVED = 0.95 # goodput must keep up with this fraction of the offered load
+SWEEP_OVERLOAD_POINTS = 2 # stop sweeping after this many failing rates
+
+# Repeated trials: every (round, SUT) pair runs several times in shuffled,
+# interleaved order, and stops early once all its confidence intervals are
+# tight enough.
+TRIAL_ROUNDS = {
+    "TrialsIO": {"path": "/io", "concurrency": 200},
+    "TrialsCPU": {"path": "/heavy", "concurrency": 4},
+}
+TRIALS = {
+    "min": 5,               # trials before a pair may stop early
+    "max": 10,              # hard cap per pair, which bounds the round's wall time
+    "duration": 10,         # seconds per trial
+    "pause": 2,             # seconds between trials
+    "confidence": 0.95,
+    "target_width": 0.05,   # stop once every CI half-width is within 5% of its mean
+    "alpha": 0.05,          # significance level for comparisons between runtimes
+    "metrics": ("goodput", "p50", "p99"),
+}
+
+# Client connection pool, overridable per round. aiohttp's default connector
+# silently caps a session at 100 connections, so the limit is always explicit.
+POOL = {
+    "limit": None,          # connections per round (None = the round's concurrency, 0 = unlimited)
+    "limit_per_host": 0,    # 0 = no per-host cap
+    "keepalive": True,      # False closes every connection after its response
+    "dns_cache": True,
+    "dns_ttl": 10,          # seconds a cached DNS entry stays valid
+}
 RESULTS = defaultdict(dict)
+COLD_START = "ColdStart"  # RESULTS key of the cold-start round, which has its own shape
+SCALING_ROUND = "Scaling" # RESULTS key of the problem-size sweep, also its own shape
+SUT_PIDS = {}           # runtime -> pid of the SUT launched by the harness (MANAGE_SUTS)
+LAUNCH_ERRORS = (SutNotReady, OSError)  # a managed SUT that raises these is skipped, not fatal
+RESULTS_FILE = "results.json"
+RESULTS_DB = "results.db"  # every run is appended here (None to disable)
+TREND_RUNS = 30         # past runs plotted in the report's trend charts
 
 # ================= UTIL =================
 
 async def warmup(url):
     print(f"☀️  Warming up {url}")
-    async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
+    failures = defaultdict(int)
+    async with aiohttp.ClientSession(timeout=TIMEOUT, trace_configs=[request_trace()]) as session:
         start = time.time()
         while time.time() - start < WARMUP_DURATION:
+            timings = new_timings()
             try:
-                async with session.get(url) as r:
+                async with session.get(url, trace_request_ctx=timings) as r:
                     await r.read()
-            except:
-                pass
+                    if r.status != 200:
+                        failures[classify_status(r.status)] += 1
+            except Exception as exc:
+                failures[classify_exception(exc, timings.sent, timings.queued)] += 1
+                # Don't spin on a SUT that refuses connections outright
+                await asyncio.sleep(0.01)
+    if failures:
+        print("⚠️  Warmup errors: " + ", ".join(f"{kind}={n}" for kind, n in failures.items()))
     print("🔥  Warmup complete\n")
 
 async def cool_down(seconds=10):
@@ -40,63 +180,1043 @@ async def cool_down(seconds=10):
         await asyncio.sleep(1)
     print("\n🔥  Ready for next round!\n")
 
-async def run_test(label, runtime, url, concurrency):
-    latencies = []
-    errors = 0
+def arrival_gap(rate, arrival=ARRIVAL):
+    # Seconds until the next intended send time of an open-loop schedule
+    if arrival == "poisson":
+        return random.expovariate(rate)
+    if arrival == "uniform":
+        return 1.0 / rate
+    raise ValueError(f"Unknown arrival process: {arrival}")
+
+def stage_span(stage, kind):
+    value = stage[kind]
+    return tuple(value) if isinstance(value, (tuple, list)) else (value, value)
+
+class LoadProfile:
+    """Piecewise-linear virtual users or request rate over time.
+
+    Built from a stage list such as
+        [{"name": "ramp", "duration": 30, "users": (0, 500)},
+         {"name": "plateau", "duration": 60, "users": 500}]
+    where a (start, end) pair ramps linearly over the stage. Every stage
+    must use the same kind: "users" (closed-loop) or "rate" (open-loop).
+    """
+
+    def __init__(self, stages):
+        kinds = {"rate" if "rate" in stage else "users" for stage in stages}
+        if len(kinds) != 1:
+            raise ValueError("Every stage of a load profile must use 'users' or every stage 'rate'")
+        self.kind = kinds.pop()
+
+        self.labels = []
+        self.bounds = []
+        elapsed = 0.0
+        for i, stage in enumerate(stages):
+            name = stage.get("name") or f"stage {i + 1}"
+            self.labels.append(name if name not in self.labels else f"{name} #{i + 1}")
+            start_level, end_level = stage_span(stage, self.kind)
+            self.bounds.append((elapsed, elapsed + stage["duration"], start_level, end_level))
+            elapsed += stage["duration"]
+        self.duration = elapsed
+        self.peak = max(max(a, b) for _, _, a, b in self.bounds)
+
+    def index(self, elapsed):
+        for i, (_, end, _, _) in enumerate(self.bounds):
+            if elapsed < end:
+                return i
+        return len(self.bounds) - 1
+
+    def level(self, elapsed):
+        start, end, a, b = self.bounds[self.index(elapsed)]
+        progress = min(1.0, max(0.0, (elapsed - start) / (end - start))) if end > start else 1.0
+        return a + (b - a) * progress
+
+    def mean_level(self, index=None):
+        bounds = self.bounds if index is None else [self.bounds[index]]
+        span = sum(end - start for start, end, _, _ in bounds)
+        if not span:
+            return None
+        return sum((a + b) / 2 * (end - start) for start, end, a, b in bounds) / span
+
+def shard_stages(stages, workers):
+    # Split every stage's users (or rate) across worker processes
+    kind = LoadProfile(stages).kind
+    shards = [[] for _ in range(workers)]
+    for stage in stages:
+        a, b = stage_span(stage, kind)
+        if kind == "rate":
+            parts = [(a / workers, b / workers)] * workers
+        else:
+            parts = list(zip(split_evenly(a, workers), split_evenly(b, workers)))
+        for shard, part in zip(shards, parts):
+            shard.append(dict(stage, **{kind: part}))
+    return shards
+
+class RunStats:
+    """Measurements from one load generator; merged across worker processes."""
+
+    def __init__(self, target_rate=None):
+        self.latencies = LatencyHistogram()
+        self.sent = 0
+        self.errors = 0
+        self.failures = {}      # error class -> time-to-failure histogram
+        self.bytes = 0
+        self.phases = PhaseTimings()
+        self.timeline = IntervalRecorder(SERIES_INTERVAL)
+        self.target_rate = target_rate
+        self.stages = {}
+        self.resources = None   # SAMPLE_DTYPE samples of the SUT, set on the aggregate
+        self.sut_workers = None # requests each SUT worker served, set on the aggregate
+        self.checked = 0        # sampled responses validated
+        self.mismatches = 0     # ...of which returned a wrong answer
+        self.mismatch_reasons = defaultdict(int)
+        self.pending = []       # sampled bodies awaiting validation
+        # Measurement window on time.monotonic(), which is system-wide, so
+        # windows from different worker processes can be combined.
+        self.started = None
+        self.finished = None
+        self.sent_until = None  # when sending stopped; responses after it are drain
+
+    def merge(self, other):
+        self.latencies.merge(other.latencies)
+        self.sent += other.sent
+        self.errors += other.errors
+        for kind, hist in other.failures.items():
+            self.failures.setdefault(kind, LatencyHistogram()).merge(hist)
+        self.bytes += other.bytes
+        self.phases.merge(other.phases)
+        self.timeline.merge(other.timeline)
+        self.checked += other.checked
+        self.mismatches += other.mismatches
+        for reason, count in other.mismatch_reasons.items():
+            self.mismatch_reasons[reason] += count
+        if other.target_rate is not None:
+            self.target_rate = (self.target_rate or 0) + other.target_rate
+        if other.started is not None:
+            self.started = other.started if self.started is None else min(self.started, other.started)
+            self.finished = other.finished if self.finished is None else max(self.finished, other.finished)
+            self.sent_until = (other.sent_until if self.sent_until is None
+                               else max(self.sent_until, other.sent_until))
+        for name, stage in other.stages.items():
+            if name not in self.stages:
+                self.stages[name] = RunStats()
+            self.stages[name].merge(stage)
+        return self
+
+    @property
+    def duration(self):
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+    @property
+    def send_window(self):
+        if self.started is None or self.sent_until is None:
+            return None
+        return self.sent_until - self.started
+
+    @property
+    def drain(self):
+        # Time spent waiting for in-flight responses after the last send
+        if self.finished is None or self.sent_until is None:
+            return None
+        return self.finished - self.sent_until
+
+    def fail(self, kind, elapsed):
+        self.errors += 1
+        self.failures.setdefault(kind, LatencyHistogram()).record(elapsed)
+
+    @property
+    def mismatch_rate(self):
+        return self.mismatches / self.checked if self.checked else None
+
+    def validate(self, validator):
+        # Runs once the measurement window is over
+        for body in self.pending:
+            reason = validator.check(body)
+            self.checked += 1
+            if reason is not None:
+                self.mismatches += 1
+                self.mismatch_reasons[reason] += 1
+        self.pending = []
+
+def validator_for(url):
+    return VALIDATORS.get(urlparse(url).path) if VALIDATION_SAMPLE else None
+
+def make_connector(pool, concurrency=None):
+    limit = pool["limit"]
+    if limit is None:
+        limit = concurrency or 0
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=pool["limit_per_host"],
+        force_close=not pool["keepalive"],
+        use_dns_cache=pool["dns_cache"],
+        ttl_dns_cache=pool["dns_ttl"],
+    )
+
+def new_timings():
+    # Per-request scratchpad the trace hooks write into (see phases.py)
+    return SimpleNamespace(request_start=None, pool_wait=0.0, queued=False, dns=0.0, connect=0.0,
+                           new_connection=False, headers_sent=None, sent=False, response_start=None)
+
+def request_trace():
+    # Stamp each phase of a request: pool wait, DNS, connect, request written
+    # and response headers. `queued` and `sent` also tell a timeout's phase.
+    def stamp(handler):
+        async def hook(session, ctx, params):
+            handler(ctx.trace_request_ctx, time.perf_counter())
+        return hook
+
+    def queued_start(t, now):
+        t.queued_at = now
+        t.queued = True
+
+    def queued_end(t, now):
+        t.pool_wait += now - t.queued_at
+        t.queued = False
+
+    def create_start(t, now):
+        t.create_at = now
+        t.new_connection = True
+
+    def create_end(t, now):
+        t.connect += now - t.create_at
+
+    def dns_start(t, now):
+        t.dns_at = now
+
+    def dns_end(t, now):
+        t.dns += now - t.dns_at
+
+    def headers_sent(t, now):
+        t.headers_sent = now
+        t.sent = True
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(stamp(lambda t, now: setattr(t, "request_start", now)))
+    trace.on_connection_queued_start.append(stamp(queued_start))
+    trace.on_connection_queued_end.append(stamp(queued_end))
+    trace.on_connection_create_start.append(stamp(create_start))
+    trace.on_connection_create_end.append(stamp(create_end))
+    trace.on_dns_resolvehost_start.append(stamp(dns_start))
+    trace.on_dns_resolvehost_end.append(stamp(dns_end))
+    trace.on_request_headers_sent.append(stamp(headers_sent))
+    trace.on_request_end.append(stamp(lambda t, now: setattr(t, "response_start", now)))
+    return trace
+
+def phase_times(t, start, now):
+    # Split one successful request's latency into PHASES; they sum to now - start
+    connect = t.connect - t.dns   # connection setup includes resolving the host
+    return {
+        "send_delay": t.request_start - start,
+        "pool_wait": t.pool_wait,
+        "dns": t.dns,
+        "connect": connect,
+        "request_sent": t.headers_sent - t.request_start - t.pool_wait - t.connect,
+        "first_byte": t.response_start - t.headers_sent,
+        "body": now - t.response_start,
+    }
+
+async def run_test(label, runtime, url, concurrency=None, rate=None, arrival=ARRIVAL,
+                   pool=POOL, duration=None, stages=None, progress=True, start_at=None, offset=0.0):
+    staged = stages is not None
+    duration = duration or TEST_DURATION
+    if not staged:
+        level = {"rate": rate} if rate is not None else {"users": concurrency}
+        stages = [dict(name=label, duration=duration, **level)]
+    profile = LoadProfile(stages)
+    open_loop_mode = profile.kind == "rate"
+
+    stats = RunStats(target_rate=profile.mean_level() if open_loop_mode else None)
+    if staged:
+        for i, name in enumerate(profile.labels):
+            stats.stages[name] = RunStats(target_rate=profile.mean_level(i) if open_loop_mode else None)
+        stage_stats = list(stats.stages.values())
     completed = 0
+    validator = validator_for(url)
 
-    semaphore = asyncio.Semaphore(concurrency)
+    async def worker(session, intended=None):
+        # Latency is measured from the intended send time when one is given,
+        # so a stalled server can't hide queueing delay (coordinated omission).
+        nonlocal completed
+        start = time.perf_counter() if intended is None else intended
+        # Staged runs record into the stage the request was sent in; the
+        # round's totals are merged from the stages afterwards.
+        bucket = stage_stats[profile.index(start - t0)] if staged else stats
+        timings = new_timings()
+        bucket.sent += 1
+        try:
+            async with session.get(url, trace_request_ctx=timings) as resp:
+                body = await resp.read()  # IMPORTANT
+                now = time.perf_counter()
+                bucket.bytes += len(body)
+                if resp.status == 200:
+                    bucket.latencies.record(now - start)
+                    stats.timeline.record(now, now - start)
+                    bucket.phases.record(now - start, phase_times(timings, start, now), timings.new_connection)
+                    if validator and random.random() < VALIDATION_SAMPLE:
+                        bucket.pending.append(body)
+                else:
+                    kind = classify_status(resp.status)
+                    bucket.fail(kind, now - start)
+                    stats.timeline.error(now, kind)
+        except Exception as exc:
+            now = time.perf_counter()
+            kind = classify_exception(exc, timings.sent, timings.queued)
+            bucket.fail(kind, now - start)
+            stats.timeline.error(now, kind)
+        completed += 1
 
-    async def worker(session):
-        nonlocal errors, completed
-        async with semaphore:
-            start = time.perf_counter()
-            try:
-                async with session.get(url) as resp:
-                    await resp.read()  # IMPORTANT
-                    if resp.status == 200:
-                        latencies.append(time.perf_counter() - start)
-                    else:
-                        errors += 1
-            except:
-                errors += 1
-            completed += 1
-
-    print(f"[{label}] {runtime} → {concurrency} concurrent users")
-
-    async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
-        start_time = time.time()
-        with tqdm(desc=f"{label} | {runtime}", unit="req") as bar:
-            while time.time() - start_time < TEST_DURATION:
-                await asyncio.gather(
-                    *[worker(session) for _ in range(concurrency)]
-                )
-                bar.update(completed - bar.n)
-
-    return latencies, errors
-
-def summarize(latencies, errors):
+    async def closed_loop(session, bar):
+        # Long-lived virtual users: each sends its next request as soon as its
+        # previous one finishes, so one slow response never idles the others.
+        # A user only runs while its gate is open; the controller opens and
+        # closes gates to follow the profile.
+        deadline = t0 + profile.duration
+        gates = [asyncio.Event() for _ in range(profile.peak)]
+
+        async def user(gate):
+            while True:
+                await gate.wait()
+                if time.perf_counter() >= deadline:
+                    return
+                await worker(session)
+
+        users = [asyncio.create_task(user(gate)) for gate in gates]
+        active = 0
+        while (now := time.perf_counter()) < deadline:
+            target = round(profile.level(now - t0))
+            for gate in gates[active:target]:
+                gate.set()
+            for gate in gates[target:active]:
+                gate.clear()
+            active = target
+            bar.update(completed - bar.n)
+            await asyncio.sleep(min(CONTROL_INTERVAL, deadline - now))
+        for gate in gates:
+            gate.set()
+        await asyncio.gather(*users)
+        bar.update(completed - bar.n)
+        return deadline     # no user sends past it
+
+    async def open_loop(session, bar):
+        # Fire on schedule regardless of how many requests are still in flight
+        in_flight = set()
+        next_send = t0 + offset
+        end_time = t0 + profile.duration
+        while next_send < end_time:
+            current_rate = profile.level(next_send - t0)
+            if current_rate <= 0:
+                next_send += CONTROL_INTERVAL
+                continue
+            await asyncio.sleep(max(0.0, next_send - time.perf_counter()))
+            task = asyncio.create_task(worker(session, next_send))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            next_send += arrival_gap(current_rate, arrival)
+            bar.update(completed - bar.n)
+        last_send = time.perf_counter()
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        bar.update(completed - bar.n)
+        return last_send
+
+    if start_at is not None:
+        await asyncio.sleep(max(0.0, start_at - time.time()))
+
+    connector = make_connector(pool, None if open_loop_mode else profile.peak)
+    async with aiohttp.ClientSession(timeout=TIMEOUT, connector=connector,
+                                     trace_configs=[request_trace()]) as session:
+        with tqdm(desc=f"{label} | {runtime}", unit="req", disable=not progress) as bar:
+            stats.started = time.monotonic()
+            t0 = time.perf_counter()
+            stats.timeline.start(t0)
+            if open_loop_mode:
+                last_send = await open_loop(session, bar)
+            else:
+                last_send = await closed_loop(session, bar)
+            stats.finished = time.monotonic()
+    # The send window is the profile, or longer if the harness fell behind
+    # schedule; draining the responses in flight after it isn't load offered
+    stats.sent_until = stats.started + max(profile.duration, last_send - t0)
+
+    if validator:
+        for bucket in stage_stats if staged else [stats]:
+            bucket.validate(validator)
+
+    if staged:
+        # Stage windows follow the schedule; the round's totals are their sum
+        target_rate = stats.target_rate
+        for (start, end, _, _), stage in zip(profile.bounds, stage_stats):
+            stage.started = stats.started + start
+            stage.finished = stage.sent_until = stats.started + end
+            stats.merge(stage)
+        stats.target_rate = target_rate
+    return stats
+
+def shard_worker(kwargs):
+    # Entry point of a load-generator process: its own event loop and connection pool
+    return asyncio.run(run_test(**kwargs, progress=False))
+
+def worker_ready():
+    # Held briefly so each warm-up task lands on a different worker
+    time.sleep(0.1)
+    return os.getpid()
+
+def spare_cores():
+    # Cores left for load generation. When SUTs are pinned to SUT_CPUS the
+    # harness already runs on the remaining cores; otherwise leave one free.
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    return max(1, (cores or 1) - (0 if SUT_CPUS else 1))
+
+def pin_load_generators():
+    # Keep the harness and the worker processes it forks off the SUT's cores
+    if SUT_CPUS and hasattr(os, "sched_setaffinity"):
+        spare = set(os.sched_getaffinity(0)) - set(SUT_CPUS)
+        if spare:
+            os.sched_setaffinity(0, spare)
+
+def sut_pid(runtime, url):
+    # The harness knows the pids it launched; otherwise find whoever owns the port
+    return SUT_PIDS.get(runtime) or pid_for_port(urlparse(url).port or 80)
+
+async def sut_worker_counts(url):
+    # Requests served so far by each worker of a SUT that reports them, else None
+    parts = urlparse(url)
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2)) as session:
+            async with session.get(f"{parts.scheme}://{parts.netloc}{SUT_WORKERS_PATH}") as resp:
+                if resp.status != 200:
+                    return None
+                counts = normalize_keys(await resp.json(content_type=None)).get("requests")
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, AttributeError):
+        return None
+    return counts if isinstance(counts, list) else None
+
+def split_evenly(total, parts):
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+async def run_round(label, runtime, url, concurrency=None, rate=None, arrival=ARRIVAL,
+                    workers=None, pool=None, duration=None, stages=None):
+    """Run one (round, SUT) measurement, sharded across worker processes.
+
+    Load is either a constant concurrency, a constant rate, or a stage list
+    (see LoadProfile) whose per-stage results are kept under stats.stages.
+    pool overrides keys of POOL for this round; an explicit connection limit
+    is split across the workers like concurrency is.
+    Returns (aggregate, per_worker) RunStats; per_worker is empty when the
+    round ran in this process. The SUT's /proc samples for the round are
+    kept in aggregate.resources.
+    """
+    pool = dict(POOL, **(pool or {}))
+    duration = duration or TEST_DURATION
+    profile = LoadProfile(stages) if stages is not None else None
+    peak_users = profile.peak if profile and profile.kind == "users" else concurrency
+    workers = workers or LOAD_WORKERS or spare_cores()
+    if peak_users is not None:
+        workers = max(1, min(workers, peak_users))
+
+    if profile is not None:
+        unit = "users" if profile.kind == "users" else "req/s"
+        print(f"[{label}] {runtime} → staged profile ({profile.duration:g}s):")
+        for name, (start, end, a, b) in zip(profile.labels, profile.bounds):
+            print(f"     {name}: {a:g}→{b:g} {unit} over {end - start:g}s")
+    elif rate is not None:
+        print(f"[{label}] {runtime} → {rate} req/s open-loop ({arrival} arrivals)")
+    else:
+        print(f"[{label}] {runtime} → {concurrency} concurrent users")
+
+    limit = pool["limit"] if pool["limit"] is not None else peak_users
+    print(f"   (pool: limit={limit or 'unlimited'}, per-host={pool['limit_per_host'] or 'unlimited'}, "
+          f"keep-alive={'on' if pool['keepalive'] else 'off'}, dns-cache={'on' if pool['dns_cache'] else 'off'})")
+
+    pid = sut_pid(runtime, url)
+    if RESOURCE_INTERVAL and pid is None:
+        print(f"   (no process found listening on {url}; SUT resources not sampled)")
+    counts_before = await sut_worker_counts(url) if SUT_WORKERS_PATH else None
+    with ResourceSampler(pid if RESOURCE_INTERVAL else None, RESOURCE_INTERVAL) as sampler:
+        if workers == 1:
+            aggregate = await run_test(label, runtime, url, concurrency, rate, arrival, pool, duration, stages)
+            per_worker = []
+        else:
+            aggregate, per_worker = await run_shards(label, runtime, url, rate, concurrency, arrival,
+                                                     workers, pool, duration, stages, profile)
+
+    if sampler.rows:
+        aggregate.resources = sampler.samples
+        for stage in aggregate.stages.values():
+            stage.resources = aggregate.resources
+    if counts_before is not None:
+        counts_after = await sut_worker_counts(url)
+        if counts_after is not None and len(counts_after) == len(counts_before):
+            aggregate.sut_workers = [after - before for before, after in zip(counts_before, counts_after)]
+    return aggregate, per_worker
+
+async def run_shards(label, runtime, url, rate, concurrency, arrival, workers, pool, duration, stages, profile):
+    print(f"   (sharded across {workers} load-generator processes)")
+    common = dict(label=label, runtime=runtime, url=url, arrival=arrival, duration=duration)
+    if pool["limit"]:
+        pools = [dict(pool, limit=max(1, l)) for l in split_evenly(pool["limit"], workers)]
+    else:
+        pools = [pool] * workers
+    if stages is not None:
+        shards = [dict(common, stages=s, pool=p) for s, p in zip(shard_stages(stages, workers), pools)]
+    elif rate is not None:
+        shards = [dict(common, rate=rate / workers, pool=p) for p in pools]
+    else:
+        shards = [dict(common, concurrency=c, pool=p)
+                  for c, p in zip(split_evenly(concurrency, workers), pools)]
+    first_rate = stage_span(stages[0], "rate")[0] if profile and profile.kind == "rate" else rate
+    if arrival == "uniform" and first_rate:
+        # Each shard sends every workers/rate seconds; stagger their first
+        # sends by 1/rate so the merged schedule is evenly spaced, not bursts
+        for i, shard in enumerate(shards):
+            shard["offset"] = i / first_rate
+
+    total = profile.duration if profile else duration
+    loop = asyncio.get_running_loop()
+    # run_round's ResourceSampler thread is already running here; forking with
+    # live threads can deadlock the child, so shards come from a forkserver.
+    # Preloading this module there keeps their boot inside WORKER_START_DELAY.
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        # Boot every worker (and the forkserver) before starting the shared
+        # clock, or the shards begin their schedules at different times
+        await asyncio.gather(*(loop.run_in_executor(executor, worker_ready) for _ in shards))
+        start_at = time.time() + WORKER_START_DELAY
+        for shard in shards:
+            shard["start_at"] = start_at
+        futures = [loop.run_in_executor(executor, shard_worker, shard) for shard in shards]
+        with tqdm(desc=f"{label} | {runtime}", total=total, unit="s",
+                  bar_format="{desc}: {bar} {n:.0f}/{total:.0f}s") as bar:
+            while not all(f.done() for f in futures):
+                await asyncio.sleep(1)
+                bar.update(min(1, bar.total - bar.n))
+        per_worker = await asyncio.gather(*futures)
+
+    aggregate = RunStats()
+    for stats in per_worker:
+        aggregate.merge(stats)
+    return aggregate, per_worker
+
+def rates(stats):
+    # Per-second figures over the send window, so the time spent draining
+    # in-flight responses at the end (reported as "drain") doesn't dilute
+    # them. Goodput counts only correct answers, scaled by the mismatch rate
+    # of the checked sample.
+    duration = stats.send_window
+    ok = len(stats.latencies) * (1 - (stats.mismatch_rate or 0))
+    if not duration:
+        return {"duration": duration, "drain": stats.drain, "throughput": None, "goodput": None,
+                "bytes_per_s": None, "target_rate": stats.target_rate, "achieved_ratio": None}
+
+    throughput = (len(stats.latencies) + stats.errors) / duration
+    return {
+        "duration": duration,
+        "drain": stats.drain,
+        "throughput": throughput,
+        "goodput": ok / duration,
+        "bytes_per_s": stats.bytes / duration,
+        "target_rate": stats.target_rate,
+        "achieved_ratio": throughput / stats.target_rate if stats.target_rate else None
+    }
+
+def summarize(stats, per_worker=()):
+    latencies = stats.latencies
     if not latencies:
-        return {
+        summary = {
             "avg": None,
+            "p50": None,
             "p95": None,
             "p99": None,
-            "errors": errors,
+            "errors": stats.errors,
             "count": 0
         }
+    else:
+        summary = {
+            "avg": latencies.mean(),
+            "p50": latencies.percentile(50),
+            "p95": latencies.percentile(95),
+            "p99": latencies.percentile(99),
+            "errors": stats.errors,
+            "count": len(latencies)
+        }
+
+    summary["sent"] = stats.sent
+    summary["error_classes"] = {
+        kind: {
+            "count": len(hist),
+            "ttf_avg": hist.mean(),
+            "ttf_p50": hist.percentile(50),
+            "ttf_p99": hist.percentile(99),
+            "ttf_max": hist.max(),
+        }
+        for kind, hist in sorted(stats.failures.items(), key=lambda item: ERROR_CLASSES.index(item[0]))
+    }
+    summary["checked"] = stats.checked
+    summary["mismatches"] = stats.mismatches
+    summary["mismatch_rate"] = stats.mismatch_rate
+    summary["mismatch_reasons"] = dict(stats.mismatch_reasons)
+    summary["histogram"] = stats.latencies
+    summary.update(rates(stats))
+    pool_wait = stats.phases.histograms["pool_wait"]
+    summary["pool_wait_avg"] = pool_wait.mean()
+    summary["pool_wait_p99"] = pool_wait.percentile(99)
+    summary["phases"] = {
+        phase: {
+            "avg": hist.mean(),
+            "p50": hist.percentile(50),
+            "p99": hist.percentile(99),
+            "max": hist.max(),
+        }
+        for phase, hist in stats.phases.histograms.items()
+    }
+    summary["new_connections"] = stats.phases.connections
+    # Where the slowest 1% spent their time
+    summary["tail_phases"] = stats.phases.tail(99)
+    summary["tail_sides"] = split_sides(summary["tail_phases"]) if summary["tail_phases"] else None
+    summary["timeline"] = stats.timeline.to_array(stats.duration)
+    if stats.resources is not None:
+        summary["usage"] = resource_usage(stats.resources, stats.started, stats.finished)
+        summary["resources"] = resource_series(stats.resources, stats.started, stats.duration, SERIES_INTERVAL)
+        if summary["usage"] and summary["resources"] is not None:
+            summary["usage"]["cpu_cores_max"] = float(max(
+                summary["resources"]["cpu_user"] + summary["resources"]["cpu_sys"]))
+        summary["efficiency"] = efficiency(summary)
+    if stats.sut_workers:
+        # How evenly the kernel spread the load: busiest worker over the mean
+        mean = sum(stats.sut_workers) / len(stats.sut_workers)
+        summary["sut_workers"] = stats.sut_workers
+        summary["sut_worker_imbalance"] = max(stats.sut_workers) / mean if mean else None
+    if stats.stages:
+        summary["stages"] = {}
+        for name, stage in stats.stages.items():
+            stage_summary = summarize(stage)
+            del stage_summary["timeline"]
+            stage_summary.pop("resources", None)
+            stage_summary["start"] = stage.started - stats.started
+            stage_summary["end"] = stage.finished - stats.started
+            summary["stages"][name] = stage_summary
+    if per_worker:
+        summary["workers"] = [summarize(w) for w in per_worker]
+    return summary
 
-    arr = np.array(latencies)
+def efficiency(summary):
+    # Work per unit of hardware the SUT used over the measurement window
+    usage = summary.get("usage")
+    if not usage or not summary["count"]:
+        return None
+    cpu_seconds = usage["cpu_user"] + usage["cpu_sys"]
+    rss_gb = usage["rss_max"] / 2**30
+    correct = summary["count"] * (1 - (summary["mismatch_rate"] or 0))
     return {
-        "avg": float(arr.mean()),
-        "p95": float(np.percentile(arr, 95)),
-        "p99": float(np.percentile(arr, 99)),
-        "errors": errors,
-        "count": len(arr)
+        "req_per_cpu_s": correct / cpu_seconds if cpu_seconds else None,
+        "rps_per_gb": summary["goodput"] / rss_gb if rss_gb else None,
+        "cpu_ms_per_req": cpu_seconds * 1000 / correct if correct else None,
     }
 
+def describe_efficiency(eff):
+    return (f"req/cpu-s={fmt_rate(eff['req_per_cpu_s'])} req/s per GB={fmt_rate(eff['rps_per_gb'])} "
+            f"cpu-ms/req={fmt(eff['cpu_ms_per_req'])}")
+
+def efficiency_ranking(data):
+    # Runtimes of one round, most requests per CPU-second first
+    ranked = [(runtime, stats["efficiency"]) for runtime, stats in data.items()
+              if stats.get("efficiency") and stats["efficiency"]["req_per_cpu_s"]]
+    return sorted(ranked, key=lambda item: item[1]["req_per_cpu_s"], reverse=True)
+
 def fmt(val):
     return f"{val:.4f}" if isinstance(val, float) else "N/A"
 
+def fmt_rate(val):
+    return f"{val:,.1f}" if isinstance(val, float) else "N/A"
+
+def describe_phases(stats):
+    # p99 of each phase, then where the slowest 1% of requests spent their time
+    line = " ".join(f"{phase}={fmt(stats['phases'][phase]['p99'])}" for phase in PHASES)
+    line += f" new-conns={stats['new_connections']}"
+    sides = stats.get("tail_sides")
+    if sides:
+        line += " | p99 tail: " + " ".join(f"{side} {share:.0%}" for side, share in sides.items())
+    return line
+
+def describe(stats):
+    line = (f"avg={fmt(stats['avg'])}s p95={fmt(stats['p95'])}s p99={fmt(stats['p99'])}s "
+            f"errors={stats['errors']} count={stats['count']} "
+            f"req/s={fmt_rate(stats['throughput'])} goodput={fmt_rate(stats['goodput'])} "
+            f"KB/s={fmt_rate(stats['bytes_per_s'] and stats['bytes_per_s'] / 1024)}")
+    if stats.get("error_classes"):
+        line += " [" + ", ".join(f"{kind}={c['count']} ttf p50={fmt(c['ttf_p50'])}s"
+                                 for kind, c in stats["error_classes"].items()) + "]"
+    if stats.get("checked"):
+        line += f" mismatches={stats['mismatches']}/{stats['checked']} checked"
+    if stats.get("pool_wait_p99"):
+        line += f" pool-wait avg={fmt(stats['pool_wait_avg'])}s p99={fmt(stats['pool_wait_p99'])}s"
+    if stats.get("sut_workers"):
+        line += (f" sut-workers={'/'.join(map(str, stats['sut_workers']))}"
+                 f" (max/mean {fmt(stats['sut_worker_imbalance'])})")
+    if stats["target_rate"]:
+        line += f" target={fmt_rate(float(stats['target_rate']))} achieved={fmt(stats['achieved_ratio'])}"
+    if stats.get("drain"):
+        line += f" drain={fmt(stats['drain'])}s"
+    usage = stats.get("usage")
+    if usage:
+        line += (f" cpu={usage['cpu_cores']:.2f} cores (user {usage['cpu_user']:.1f}s sys {usage['cpu_sys']:.1f}s)"
+                 f" rss={fmt_rate(usage['rss_max'] / 2**20)}MB threads={usage['threads_max']:.0f}"
+                 f" fds={usage['fds_max']:.0f} ctx-sw={usage['ctx_voluntary']:.0f}/{usage['ctx_involuntary']:.0f}")
+    return line
+
+# ================= CAPACITY SEARCH =================
+
+def check_slo(summary, max_error_rate, p99_slo):
+    """Return (passed, reason) for one probe's summary."""
+    total = summary["count"] + summary["errors"]
+    if not total:
+        return False, "no responses"
+    error_rate = summary["errors"] / total
+    if error_rate > max_error_rate:
+        return False, f"error rate {error_rate:.2%}"
+    if summary.get("mismatches"):
+        return False, f"{summary['mismatches']} wrong answers"
+    if not summary["count"]:
+        # Every request failed, which a max_error_rate of 1.0 still lets through
+        return False, "no successful responses"
+    if p99_slo is not None and summary["p99"] > p99_slo:
+        return False, f"p99 {summary['p99']:.3f}s > {p99_slo}s"
+    return True, "ok"
+
+def curve_point(level, summary, passed, reason):
+    total = summary["count"] + summary["errors"]
+    return {
+        "level": level,
+        "passed": passed,
+        "reason": reason,
+        "avg": summary["avg"],
+        "p95": summary["p95"],
+        "p99": summary["p99"],
+        "throughput": summary["throughput"],
+        "goodput": summary["goodput"],
+        "achieved_ratio": summary["achieved_ratio"],
+        "error_rate": summary["errors"] / total if total else None,
+    }
+
+async def find_capacity(label, runtime, url, search=None):
+    """Search for the highest load level that still meets the pass criteria.
+
+    Returns the summary of the best passing probe (or of the first probe if
+    none passed) with "max_sustainable", "first_failing" and the measured
+    "curve" added.
+    """
+    search = dict(SEARCH, **(search or {}))
+    users = search["kind"] == "users"
+    probes = {}
+
+    async def probe(level):
+        level = max(1, round(level)) if users else level
+        if level in probes:
+            return level, probes[level]["passed"]
+        load = {"concurrency": level} if users else {"rate": level}
+        stats, shards = await run_round(label, runtime, url, duration=search["step_duration"], **load)
+        summary = summarize(stats, shards)
+        passed, reason = check_slo(summary, search["max_error_rate"], search["p99_slo"])
+        print(f"   {'✅' if passed else '❌'}  {level:g} {'users' if users else 'req/s'}: {reason}")
+        probes[level] = {"passed": passed, "summary": summary,
+                         "point": curve_point(level, summary, passed, reason)}
+        await asyncio.sleep(search["pause"])
+        return level, passed
+
+    passing = failing = None
+    level = search["start"]
+    while True:
+        # Clamped, so the limit itself is probed before the search gives up
+        level, passed = await probe(min(level, search["limit"]))
+        if not passed:
+            failing = level
+            break
+        passing = level
+        if level >= search["limit"]:
+            break
+        level *= search["growth"]
+
+    # Bisect the bracket; user counts stop when no integer is left between
+    while passing is not None and failing is not None:
+        gap = failing - passing
+        if gap / failing <= search["resolution"] or (users and gap <= 1):
+            break
+        level, passed = await probe((passing + failing) / 2)
+        if passed:
+            passing = level
+        else:
+            failing = level
+
+    best = probes[passing] if passing is not None else probes[min(probes)]
+    result = dict(best["summary"])
+    result["max_sustainable"] = passing
+    result["first_failing"] = failing
+    result["search_kind"] = search["kind"]
+    result["curve"] = [probes[l]["point"] for l in sorted(probes)]
+    result["curve_x"] = "level"
+    if failing is None:
+        print(f"   Survived up to the search limit ({search['limit']:g})")
+    print(f"🏆  Max sustainable load for {runtime}: {passing if passing is not None else 'none'}\n")
+    return result
+
+def find_knee(points):
+    # Index of the last passing rate before the first failing one
+    knee = None
+    for i, point in enumerate(points):
+        if not point["passed"]:
+            break
+        knee = i
+    return knee
+
+async def sweep_rates(label, runtime, url, rates, p99_slo):
+    """Run a series of open-loop rates and locate the saturation knee.
+
+    A rate passes while p99 stays under p99_slo and goodput keeps up with
+    SWEEP_MIN_ACHIEVED of the offered load. Returns the summary at the knee with
+    "max_throughput_at_slo", "knee_rate" and the latency-vs-throughput
+    "curve" added.
+    """
+    points = []
+    summaries = []
+    for rate in sorted(rates):
+        stats, shards = await run_round(label, runtime, url, rate=rate, duration=SWEEP_STEP_DURATION)
+        summary = summarize(stats, shards)
+        passed, reason = check_slo(summary, 1.0, p99_slo)
+        # Goodput relative to the load actually offered, so Poisson noise in
+        # short steps doesn't read as falling behind
+        kept_up = summary["count"] / summary["sent"] if summary["sent"] else 0.0
+        if passed and kept_up < SWEEP_MIN_ACHIEVED:
+            passed, reason = False, f"goodput {kept_up:.0%} of offered load"
+        print(f"   {'✅' if passed else '❌'}  {rate:g} req/s: {reason}")
+        points.append(curve_point(rate, summary, passed, reason))
+        summaries.append(summary)
+        if sum(not p["passed"] for p in points) >= SWEEP_OVERLOAD_POINTS:
+            break
+        await asyncio.sleep(SEARCH["pause"])
+
+    knee = find_knee(points)
+    result = dict(summaries[knee if knee is not None else 0])
+    result["knee_rate"] = points[knee]["level"] if knee is not None else None
+    result["max_throughput_at_slo"] = points[knee]["goodput"] if knee is not None else None
+    result["p99_slo"] = p99_slo
+    result["max_sustainable"] = result["knee_rate"]
+    result["first_failing"] = next((p["level"] for p in points if not p["passed"]), None)
+    result["search_kind"] = "rate"
+    result["curve"] = points
+    result["curve_x"] = "goodput"
+    print(f"🏆  Max throughput at p99 ≤ {p99_slo}s for {runtime}: "
+          f"{fmt_rate(result['max_throughput_at_slo'])} req/s\n")
+    return result
+
+# ================= COLD START =================
+
+def distribution(values):
+    values = np.array([v for v in values if v is not None], dtype=float)
+    if not len(values):
+        return None
+    return {
+        "min": float(values.min()),
+        "median": float(np.median(values)),
+        "p90": float(np.percentile(values, 90)),
+        "max": float(values.max()),
+        "mean": float(values.mean()),
+    }
+
+async def cold_start(name, base):
+    # One fresh launch: startup timings, the first requests' latencies and idle memory
+    url = f"{base}/io"
+    async with SutProcess(name) as sut:
+        latencies = []
+        async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
+            for _ in range(COLD_START_REQUESTS):
+                start = time.perf_counter()
+                try:
+                    async with session.get(url) as r:
+                        await r.read()
+                        ok = r.status == 200
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    ok = False
+                latencies.append(time.perf_counter() - start if ok else None)
+        await asyncio.sleep(COLD_START_SETTLE)
+        return {
+            "port_bound": sut.port_bound_at - sut.launched_at,
+            "first_response": sut.ready_at - sut.launched_at,
+            "first_latency": sut.first_response_latency,
+            "idle_rss": tree_rss(sut.pid),
+            "latencies": latencies,
+        }
+
+def summarize_cold_starts(launches):
+    # Distributions over repeated launches; the curve is the per-request median
+    curves = np.array([[np.nan if v is None else v for v in launch["latencies"]] for launch in launches])
+    ok = ~np.isnan(curves)
+    curve = [float(np.median(curves[ok[:, i], i])) if ok[:, i].any() else None
+             for i in range(curves.shape[1])]
+    return {
+        "repeats": len(launches),
+        "port_bound": distribution(launch["port_bound"] for launch in launches),
+        "first_response": distribution(launch["first_response"] for launch in launches),
+        "first_latency": distribution(launch["first_latency"] for launch in launches),
+        "idle_rss": distribution(launch["idle_rss"] for launch in launches),
+        "curve": curve,
+        "errors": int((~ok).sum()),
+        "launches": launches,
+    }
+
+def describe_cold_start(stats):
+    def median(key, scale=1.0):
+        dist = stats[key]
+        return dist and dist["median"] * scale
+
+    return (f"port bound={fmt(median('port_bound'))}s first 200={fmt(median('first_response'))}s "
+            f"first request={fmt(median('first_latency'))}s "
+            f"idle RSS={fmt_rate(median('idle_rss', 1 / 2**20))}MB "
+            f"errors={stats['errors']} (median of {stats['repeats']} launches)")
+
+# ================= PROBLEM-SIZE SCALING =================
+
+async def heavy_result(session, base, n, algo):
+    # (latency, server-reported ms, Result) of one /heavy?n=&algo= request, or None
+    start = time.perf_counter()
+    try:
+        async with session.get(f"{base}/heavy", params={"n": n, "algo": algo}) as r:
+            body = await r.read()
+            if r.status != 200:
+                return None
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+    latency = time.perf_counter() - start
+    try:
+        data = normalize_keys(json.loads(body))
+    except ValueError:
+        return None
+    return latency, data.get("durationms"), data.get("result")
+
+async def scaling_sweep(name, base):
+    points = []
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=SCALING["timeout"])) as session:
+        # A SUT that ignores n answers the 20000th prime for n=10 too
+        probe = await heavy_result(session, base, 10, "naive")
+        if probe is None or probe[2] != 29:
+            return None
+        for algo in SCALING["algos"]:
+            for n in SCALING["ns"]:
+                latencies, server_ms, answers = [], [], set()
+                started = time.perf_counter()
+                while len(latencies) < SCALING["requests"] and time.perf_counter() - started < SCALING["budget"]:
+                    result = await heavy_result(session, base, n, algo)
+                    if result is None:
+                        break
+                    latencies.append(result[0])
+                    if result[1] is not None:
+                        server_ms.append(result[1])
+                    answers.add(result[2])
+                if not latencies:
+                    print(f"   {algo} n={n}: no successful response; skipping larger n")
+                    break
+                point = {
+                    "algo": algo,
+                    "n": n,
+                    "requests": len(latencies),
+                    "p50": float(np.median(latencies)),
+                    "min": min(latencies),
+                    "server_ms_p50": float(np.median(server_ms)) if server_ms else None,
+                    "results": sorted(answers, key=str),
+                }
+                points.append(point)
+                print(f"   {algo} n={n:,}: p50={fmt(point['p50'])}s over {point['requests']} requests")
+                if point["p50"] > SCALING["max_median"]:
+                    break
+    return points
+
+def summarize_scaling(points):
+    # Every algorithm has to give the same (single) answer for the same n
+    answers = defaultdict(set)
+    for point in points:
+        answers[point["n"]].update(map(str, point["results"]))
+    return {
+        "points": points,
+        "disagreements": [n for n, results in answers.items() if len(results) > 1],
+    }
+
+def describe_scaling(stats):
+    by_algo = defaultdict(list)
+    for point in stats["points"]:
+        by_algo[point["algo"]].append(f"{point['n']:,}={fmt(point['p50'])}s")
+    line = " | ".join(f"{algo}: " + " ".join(values) for algo, values in by_algo.items())
+    if stats["disagreements"]:
+        line += f" ⚠️ algorithms disagree at n={', '.join(map(str, stats['disagreements']))}"
+    return line
+
+# ================= REPEATED TRIALS =================
+
+def trial_values(summaries, metric):
+    return [s[metric] for s in summaries if s[metric] is not None]
+
+def trials_converged(summaries):
+    for metric in TRIALS["metrics"]:
+        values = trial_values(summaries, metric)
+        if relative_half_width(values, bootstrap_ci(values, TRIALS["confidence"])) > TRIALS["target_width"]:
+            return False
+    return True
+
+def summarize_trials(trial_stats, summaries):
+    # Latencies pooled over every trial, rates over their summed measurement
+    # time; the per-trial values carry the run-to-run noise.
+    pooled = RunStats()
+    for stats in trial_stats:
+        pooled.merge(stats)
+    pooled.started = 0.0
+    pooled.finished = sum(stats.duration for stats in trial_stats)
+    pooled.sent_until = sum(stats.send_window for stats in trial_stats)
+    pooled.target_rate = trial_stats[0].target_rate
+    pooled.timeline = IntervalRecorder(SERIES_INTERVAL)
+    summary = summarize(pooled)
+
+    metrics = {}
+    for metric in TRIALS["metrics"]:
+        values = trial_values(summaries, metric)
+        ci = bootstrap_ci(values, TRIALS["confidence"])
+        metrics[metric] = {
+            "values": values,
+            "mean": float(np.mean(values)) if values else None,
+            "ci": ci,
+            "half_width": relative_half_width(values, ci),
+        }
+    summary["trials"] = {"n": len(summaries), "confidence": TRIALS["confidence"],
+                         "metrics": metrics, "versus": {}}
+    return summary
+
+def compare_trials():
+    # Pairwise permutation tests between runtimes, for every metric of every trial round
+    for test in TRIAL_ROUNDS:
+        data = {runtime: stats for runtime, stats in RESULTS.get(test, {}).items() if "trials" in stats}
+        runtimes = list(data)
+        for i, a in enumerate(runtimes):
+            for b in runtimes[i + 1:]:
+                result = {metric: permutation_test(data[a]["trials"]["metrics"][metric]["values"],
+                                                   data[b]["trials"]["metrics"][metric]["values"])
+                          for metric in TRIALS["metrics"]}
+                data[a]["trials"]["versus"][b] = result
+                data[b]["trials"]["versus"][a] = result
+
+def describe_trials(trials):
+    parts = []
+    for metric, m in trials["metrics"].items():
+        show = fmt_rate if metric == "goodput" else fmt
+        ci = f" [{show(m['ci'][0])}, {show(m['ci'][1])}]" if m["ci"] else ""
+        parts.append(f"{metric}={show(m['mean'])}{ci}")
+    return f"n={trials['n']} " + " ".join(parts) + f" ({trials['confidence']:.0%} CI)"
+
+def describe_versus(versus):
+    alpha = TRIALS["alpha"]
+    return " ".join(f"{metric} p={p:.3f}{'*' if p < alpha else ''}" if p is not None else f"{metric} p=N/A"
+                    for metric, p in versus.items())
+
 # ================= TEST ROUNDS =================
 
 SUTS = [
@@ -104,54 +1224,235 @@ SUTS = [
     ("Dotnet", DOTNET),
     ("Go", GO),
     ("Dotnet AOT", DOTNET_AOT),
-    ("Python", PYTHON)
+    ("Python", PYTHON),
+    ("Python (thread)", PYTHON_THREAD),
+    ("Python (backend)", PYTHON_BACKEND),
+    ("Python (workers)", PYTHON_WORKERS)
 ]
 
-async def baseline_test():
+async def baseline_test(suts=SUTS):
     print("\n--- ROUND 0: BASELINE (IO, SINGLE USER) ---")
-    for name, base in SUTS:
+    for name, base in suts:
         url = f"{base}/io"
         await warmup(url)
-        lat, err = await run_test("Baseline", name, url, concurrency=1)
-        RESULTS["Baseline"][name] = summarize(lat, err)
+        stats, shards = await run_round("Baseline", name, url, concurrency=1)
+        RESULTS["Baseline"][name] = summarize(stats, shards)
 
-async def io_test():
+async def io_test(suts=SUTS):
     print("\n--- ROUND 1: IO-BOUND (ASYNC SCALABILITY) ---")
-    for name, base in SUTS:
+    for name, base in suts:
         url = f"{base}/io"
         await warmup(url)
-        lat, err = await run_test("IO", name, url, concurrency=200)
-        RESULTS["IO"][name] = summarize(lat, err)
+        stats, shards = await run_round("IO", name, url, concurrency=200)
+        RESULTS["IO"][name] = summarize(stats, shards)
 
-async def cpu_test():
+async def cpu_test(suts=SUTS):
     print("\n--- ROUND 2: CPU-BOUND (PRIME CALCULATION) ---")
-    for name, base in SUTS:
+    for name, base in suts:
         url = f"{base}/heavy"
         await warmup(url)
-        lat, err = await run_test("CPU", name, url, concurrency=4)
-        RESULTS["CPU"][name] = summarize(lat, err)
+        stats, shards = await run_round("CPU", name, url, concurrency=4)
+        RESULTS["CPU"][name] = summarize(stats, shards)
 
-async def sustained_test():
+    # Same work with each runtime's fastest prime engine; SUTs with only
+    # the naive one run plain /heavy again
+    for name, base in suts:
+        algo = BEST_PRIME_ALGO.get(name)
+        url = f"{base}/heavy?algo={algo}" if algo else f"{base}/heavy"
+        await warmup(url)
+        stats, shards = await run_round("CPUBest", name, url, concurrency=4)
+        RESULTS["CPUBest"][name] = summarize(stats, shards)
+
+async def sustained_test(suts=SUTS):
     print("\n--- ROUND 3: SUSTAINED LOAD (TAIL LATENCY) ---")
-    for name, base in SUTS:
+    for name, base in suts:
+        url = f"{base}/io"
+        await warmup(url)
+        stats, shards = await run_round("Sustained", name, url, concurrency=300)
+        RESULTS["Sustained"][name] = summarize(stats, shards)
+
+async def open_loop_test(suts=SUTS):
+    print("\n--- ROUND 4: OPEN-LOOP (CONSTANT ARRIVAL RATE) ---")
+    for name, base in suts:
+        url = f"{base}/io"
+        await warmup(url)
+        stats, shards = await run_round("OpenIO", name, url, rate=IO_RATE)
+        RESULTS["OpenIO"][name] = summarize(stats, shards)
+
+    for name, base in suts:
+        url = f"{base}/heavy"
+        await warmup(url)
+        stats, shards = await run_round("OpenCPU", name, url, rate=CPU_RATE)
+        RESULTS["OpenCPU"][name] = summarize(stats, shards)
+
+async def profile_test(suts=SUTS):
+    print("\n--- ROUND 5: STAGED LOAD PROFILE (RAMP / PLATEAU / SPIKE) ---")
+    for name, base in suts:
+        url = f"{base}/io"
+        await warmup(url)
+        stats, shards = await run_round("Profile", name, url, stages=LOAD_PROFILE)
+        RESULTS["Profile"][name] = summarize(stats, shards)
+
+async def breaking_point_test(suts=SUTS):
+    print("\n--- ROUND 6: BREAKING POINT (CAPACITY SEARCH) ---")
+    for name, base in suts:
         url = f"{base}/io"
         await warmup(url)
-        lat, err = await run_test("Sustained", name, url, concurrency=300)
-        RESULTS["Sustained"][name] = summarize(lat, err)
+        RESULTS["Breaking"][name] = await find_capacity("Breaking", name, url)
+        await cool_down(5)
+
+async def trials_test(suts=SUTS):
+    print("\n--- ROUND 8: REPEATED TRIALS (CONFIDENCE INTERVALS) ---")
+    pending = [(test, name, base) for test in TRIAL_ROUNDS for name, base in suts]
+    runs = {(test, name): ([], []) for test, name, _ in pending}
+    dropped = set()         # SUTs that failed to launch
+    for trial in range(TRIALS["max"]):
+        # Every pending pair once per block, in a fresh random order, so drift
+        # over the session spreads evenly across runtimes
+        random.shuffle(pending)
+        print(f"🎲  Trial {trial + 1}: " + ", ".join(f"{test}/{name}" for test, name, _ in pending))
+        for test, name, base in pending:
+            if name in dropped:
+                continue
+            spec = TRIAL_ROUNDS[test]
+            url = f"{base}{spec['path']}"
+            # A managed SUT is launched for this one run, so the block still
+            # interleaves runtimes while only one of them is up at a time
+            try:
+                async with managed_sut(name):
+                    await warmup(url)
+                    stats, _ = await run_round(test, name, url, concurrency=spec.get("concurrency"),
+                                               rate=spec.get("rate"), duration=TRIALS["duration"])
+            except LAUNCH_ERRORS as e:
+                print(f"❌  {name} failed, dropping it from the trials: {e}")
+                dropped.add(name)
+                continue
+            stats_list, summaries = runs[(test, name)]
+            stats_list.append(stats)
+            summaries.append(summarize(stats))
+            await asyncio.sleep(TRIALS["pause"])
+        pending = [p for p in pending if p[1] not in dropped]
+        if not pending:
+            break
+        if trial + 1 >= TRIALS["min"]:
+            done = [(test, name) for test, name, _ in pending if trials_converged(runs[(test, name)][1])]
+            for test, name in done:
+                print(f"✅  {test}/{name}: intervals within ±{TRIALS['target_width']:.0%} after {trial + 1} trials")
+            pending = [p for p in pending if (p[0], p[1]) not in done]
+            if not pending:
+                break
+
+    for (test, name), (stats_list, summaries) in runs.items():
+        if stats_list:
+            RESULTS[test][name] = summarize_trials(stats_list, summaries)
+
+async def cold_start_test(suts=SUTS):
+    # Launches every SUT itself, so it only runs when the harness manages the SUTs
+    print("\n--- COLD START (FRESH LAUNCHES) ---")
+    for name, base in suts:
+        launches = []
+        try:
+            for _ in range(COLD_START_REPEATS):
+                launches.append(await cold_start(name, base))
+                await asyncio.sleep(1)
+        except LAUNCH_ERRORS as e:
+            print(f"❌  {name} failed to launch, skipping its cold start: {e}")
+            continue
+        RESULTS[COLD_START][name] = summarize_cold_starts(launches)
+        print(f"⏱️  {name}: {describe_cold_start(RESULTS[COLD_START][name])}")
+
+async def scaling_test(suts=SUTS):
+    print("\n--- ROUND 9: PROBLEM-SIZE SCALING (/heavy?n=) ---")
+    for name, base in suts:
+        print(f"[{SCALING_ROUND}] {name}")
+        points = await scaling_sweep(name, base)
+        if points is None:
+            print(f"   {name} ignores n; skipped")
+            continue
+        RESULTS[SCALING_ROUND][name] = summarize_scaling(points)
+
+async def sweep_test(suts=SUTS):
+    print("\n--- ROUND 7: RATE SWEEP (MAX THROUGHPUT AT SLO) ---")
+    for test, sweep in SWEEP.items():
+        for name, base in suts:
+            url = f"{base}{sweep['path']}"
+            await warmup(url)
+            RESULTS[test][name] = await sweep_rates(test, name, url, sweep["rates"], sweep["p99_slo"])
+            await cool_down(5)
 
 # ================= HTML REPORT =================
 
+def curve_chart(canvas_id, datasets, x_label, y_label, log=False):
+    # log: logarithmic x and y, for curves spanning orders of magnitude
+    scale = "type: 'logarithmic'," if log else "beginAtZero: true,"
+    return f"""
+        new Chart(document.getElementById('{canvas_id}'), {{
+            type: 'scatter',
+            data: {{ datasets: {json.dumps(datasets)} }},
+            options: {{
+                responsive: true,
+                plugins: {{
+                    legend: {{ labels: {{ color: '#94a3b8', boxWidth: 12 }} }},
+                    tooltip: {{ backgroundColor: '#1e293b', padding: 12 }}
+                }},
+                scales: {{
+                    y: {{
+                        {scale}
+                        title: {{ display: true, text: '{y_label}', color: '#94a3b8' }},
+                        grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    x: {{
+                        {"type: 'logarithmic'," if log else ""}
+                        title: {{ display: true, text: '{x_label}', color: '#94a3b8' }},
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }}
+                }}
+            }}
+        }});
+        """
+
+def run_trends(test):
+    # p99 and goodput per runtime across the last TREND_RUNS stored runs of a round
+    if not RESULTS_DB or not os.path.exists(RESULTS_DB):
+        return None
+    runs = {}
+    values = {}
+    for lang, _ in SUTS:
+        for metric in ("p99", "goodput"):
+            for run_id, started_at, rev, value in store.history(RESULTS_DB, lang, test, metric, TREND_RUNS):
+                runs[run_id] = (started_at, rev)
+                values[(lang, metric, run_id)] = value
+    if len(runs) < 2:
+        return None
+    order = sorted(runs, key=lambda run_id: runs[run_id][0])[-TREND_RUNS:]
+    labels = [f"{time.strftime('%m-%d %H:%M', time.localtime(runs[r][0]))} {(runs[r][1] or '')[:7]}".strip()
+              for r in order]
+    return labels, {(lang, metric): [values.get((lang, metric, r)) for r in order]
+                    for lang, _ in SUTS for metric in ("p99", "goodput")}
+
 def generate_html():
     # Helper to restructure data for charts
     def get_metric(metric_name):
         return {test: {runtime: data.get(runtime, {}).get(metric_name) for runtime in [s[0] for s in SUTS]} for test, data in RESULTS.items()}
     
+    # Runtimes with results for a round, in SUTS order; a skipped SUT has none
+    def tested(test):
+        return [lang for lang, _ in SUTS if lang in RESULTS[test]]
+
+    # The cold-start and scaling rounds have their own cards; every other round is a load summary
+    load_rounds = [test for test in RESULTS if test not in (COLD_START, SCALING_ROUND)]
+    trends = {test: run_trends(test) for test in load_rounds}
+
     # Generate cards HTML
     cards_html = ""
-    for test in RESULTS:
+    for test in load_rounds:
         stats_avg_html = ""
         stats_err_html = ""
-        for lang, _ in SUTS:
+        stats_rate_html = ""
+        stats_usage_html = ""
+        for lang in tested(test):
             stats_avg_html += f"""
             <div class="stat-item">
                 <span class="stat-label">{lang} Avg</span>
@@ -160,12 +1461,173 @@ def generate_html():
             
             err_count = RESULTS[test][lang]['errors']
             err_color = '#ef4444' if err_count > 0 else '#4ade80'
+            wrong = RESULTS[test][lang].get('mismatches', 0)
+            checked = RESULTS[test][lang].get('checked', 0)
+            classes_html = "".join(
+                f'<span class="stat-label">{kind} {c["count"]} · ttf p50 {fmt(c["ttf_p50"])}s</span>'
+                for kind, c in RESULTS[test][lang].get("error_classes", {}).items())
+            wrong_html = (f"""
+                <span class="stat-label" style="color: {'#ef4444' if wrong else 'var(--text-dim)'}">{wrong}/{checked} wrong answers</span>"""
+                          if checked else "")
             stats_err_html += f"""
             <div class="stat-item">
                 <span class="stat-label">{lang} Err</span>
-                <span class="stat-val" style="color: {err_color}">{err_count}</span>
+                <span class="stat-val" style="color: {err_color}">{err_count}</span>{classes_html}{wrong_html}
             </div>"""
 
+            stats = RESULTS[test][lang]
+            achieved = f" ({stats['achieved_ratio']:.0%} of target)" if stats['achieved_ratio'] is not None else ""
+            achieved += f" · drain {fmt(stats['drain'])}s" if stats.get('drain') else ""
+            sut_workers = (f"""
+                <span class="stat-label">SUT workers {' / '.join(map(str, stats['sut_workers']))} (max/mean {fmt(stats['sut_worker_imbalance'])})</span>"""
+                           if stats.get("sut_workers") else "")
+            stats_rate_html += f"""
+            <div class="stat-item">
+                <span class="stat-label">{lang} req/s · goodput</span>
+                <span class="stat-val">{fmt_rate(stats['throughput'])} · {fmt_rate(stats['goodput'])}</span>
+                <span class="stat-label">{fmt_rate(stats['bytes_per_s'] and stats['bytes_per_s'] / 1024)} KB/s{achieved}</span>
+                <span class="stat-label">pool wait p99 {fmt(stats['pool_wait_p99'])}s</span>{sut_workers}
+            </div>"""
+
+            usage = stats.get("usage")
+            if usage:
+                stats_usage_html += f"""
+            <div class="stat-item">
+                <span class="stat-label">{lang} CPU · RSS</span>
+                <span class="stat-val">{usage['cpu_cores']:.2f} cores · {fmt_rate(usage['rss_max'] / 2**20)} MB</span>
+                <span class="stat-label">threads {usage['threads_max']:.0f} · fds {usage['fds_max']:.0f}</span>
+                <span class="stat-label">ctx-sw {usage['ctx_voluntary']:,.0f} vol · {usage['ctx_involuntary']:,.0f} invol</span>
+            </div>"""
+
+        # Staged rounds: p99 and goodput for every stage of the profile
+        stages_html = ""
+        stage_names = next((list(RESULTS[test][lang]["stages"]) for lang in tested(test)
+                            if "stages" in RESULTS[test][lang]), [])
+        if stage_names:
+            header = "".join(f"<th>{lang}</th>" for lang in tested(test))
+            rows = ""
+            for stage in stage_names:
+                cells = ""
+                for lang in tested(test):
+                    stage_stats = RESULTS[test][lang].get("stages", {}).get(stage)
+                    cells += (f"<td>{fmt(stage_stats['p99'])}s · {fmt_rate(stage_stats['goodput'])}/s</td>"
+                              if stage_stats else "<td>N/A</td>")
+                rows += f"<tr><td class=\"stat-label\">{stage}</td>{cells}</tr>"
+            stages_html = f"""
+            <table class="stage-table">
+                <tr><th>Stage (p99 · goodput)</th>{header}</tr>
+                {rows}
+            </table>"""
+
+        # Capacity search: max sustainable level and the measured curve
+        capacity_html = ""
+        if any("curve" in RESULTS[test][lang] for lang in tested(test)):
+            items = ""
+            for lang in tested(test):
+                stats = RESULTS[test][lang]
+                if "max_throughput_at_slo" in stats:
+                    label = f"{lang} req/s @ p99 ≤ {stats['p99_slo']}s"
+                    best = fmt_rate(stats["max_throughput_at_slo"])
+                else:
+                    label = f"{lang} Max {stats.get('search_kind', '')}"
+                    best = stats.get("max_sustainable")
+                items += f"""
+            <div class="stat-item">
+                <span class="stat-label">{label}</span>
+                <span class="stat-val">{best if best is not None else 'N/A'}</span>
+            </div>"""
+            capacity_html = f"""
+             <div class="stats-grid" style="margin-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 10px;">
+                {items}
+            </div>
+            <canvas id="{test}Curve" style="margin-top: 20px;"></canvas>"""
+
+        # Repeated trials: confidence intervals and pairwise significance
+        trials_html = ""
+        if any("trials" in RESULTS[test][lang] for lang in tested(test)):
+            items = ""
+            for lang in tested(test):
+                trials = RESULTS[test][lang].get("trials")
+                if not trials:
+                    continue
+                lines = ""
+                for metric, m in trials["metrics"].items():
+                    show = fmt_rate if metric == "goodput" else fmt
+                    ci = f"[{show(m['ci'][0])}, {show(m['ci'][1])}]" if m["ci"] else ""
+                    lines += f'<span class="stat-label">{metric} {show(m["mean"])} {ci}</span>'
+                items += f"""
+            <div class="stat-item">
+                <span class="stat-label">{lang} ({trials['n']} trials, {trials['confidence']:.0%} CI)</span>
+                {lines}
+            </div>"""
+            header = "".join(f"<th>{lang}</th>" for lang in tested(test))
+            rows = ""
+            for lang in tested(test):
+                versus = RESULTS[test][lang].get("trials", {}).get("versus", {})
+                cells = ""
+                for other in tested(test):
+                    result = versus.get(other)
+                    cells += (f"<td>{describe_versus(result).replace('*', ' ✱')}</td>"
+                              if result else "<td>–</td>")
+                rows += f"<tr><td class=\"stat-label\">{lang}</td>{cells}</tr>"
+            trials_html = f"""
+             <div class="stats-grid" style="margin-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 10px;">
+                {items}
+            </div>
+            <table class="stage-table">
+                <tr><th>Permutation test (✱ p &lt; {TRIALS['alpha']})</th>{header}</tr>
+                {rows}
+            </table>"""
+
+        # Request phases: where the time goes, client side vs server side
+        phases_html = ""
+        phased = [lang for lang in tested(test) if RESULTS[test][lang].get("tail_phases")]
+        if phased:
+            header = "".join(f"<th>{lang}</th>" for lang in phased)
+            rows = ""
+            for phase in PHASES:
+                cells = "".join(f"<td>{fmt(RESULTS[test][lang]['phases'][phase]['p50'])}s · "
+                                f"{fmt(RESULTS[test][lang]['phases'][phase]['p99'])}s</td>" for lang in phased)
+                rows += f"<tr><td class=\"stat-label\">{phase}</td>{cells}</tr>"
+            cells = "".join("<td>" + " · ".join(f"{side} {share:.0%}" for side, share in
+                                                 RESULTS[test][lang]["tail_sides"].items()) + "</td>"
+                            if RESULTS[test][lang]["tail_sides"] else "<td>N/A</td>" for lang in phased)
+            rows += f"<tr><td class=\"stat-label\">p99 tail split</td>{cells}</tr>"
+            phases_html = f"""
+            <table class="stage-table">
+                <tr><th>Phase (p50 · p99)</th>{header}</tr>
+                {rows}
+            </table>
+            <canvas id="{test}Phases" style="margin-top: 20px;"></canvas>"""
+
+        # Efficiency: runtimes ranked by requests per CPU-second
+        efficiency_html = ""
+        ranking = efficiency_ranking(RESULTS[test])
+        if ranking:
+            items = ""
+            for rank, (lang, eff) in enumerate(ranking, 1):
+                items += f"""
+            <div class="stat-item">
+                <span class="stat-label">#{rank} {lang} req/CPU-s</span>
+                <span class="stat-val">{fmt_rate(eff['req_per_cpu_s'])}</span>
+                <span class="stat-label">{fmt_rate(eff['rps_per_gb'])} req/s per GB</span>
+                <span class="stat-label">{fmt(eff['cpu_ms_per_req'])} CPU-ms/req</span>
+            </div>"""
+            efficiency_html = f"""
+             <div class="stats-grid" style="margin-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 10px;">
+                {items}
+            </div>
+            <canvas id="{test}Efficiency" style="margin-top: 20px;"></canvas>"""
+
+        # SUT resource usage: per-round totals and a CPU / RSS timeline
+        resources_html = ""
+        if stats_usage_html:
+            resources_html = f"""
+             <div class="stats-grid" style="margin-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 10px;">
+                {stats_usage_html}
+            </div>
+            <canvas id="{test}Resources" style="margin-top: 20px;"></canvas>"""
+
         cards_html += f"""
         <div class="card">
             <h2>{test}</h2>
@@ -176,6 +1638,69 @@ def generate_html():
              <div class="stats-grid" style="margin-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 10px;">
                 {stats_err_html}
             </div>
+             <div class="stats-grid" style="margin-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); padding-top: 10px;">
+                {stats_rate_html}
+            </div>
+            {stages_html}
+            {phases_html}
+            {trials_html}
+            {capacity_html}
+            <canvas id="{test}Timeline" style="margin-top: 20px;"></canvas>
+            {resources_html}
+            {efficiency_html}
+            {f'<canvas id="{test}Trend" style="margin-top: 20px;"></canvas>' if trends[test] else ''}
+        </div>
+        """
+
+    # Cold start: median startup timings, idle memory and the first requests' latency
+    cold_starts = RESULTS.get(COLD_START, {})
+    if cold_starts:
+        items = ""
+        for lang, stats in cold_starts.items():
+            items += f"""
+            <div class="stat-item">
+                <span class="stat-label">{lang} first 200</span>
+                <span class="stat-val">{fmt(stats['first_response'] and stats['first_response']['median'])}s</span>
+                <span class="stat-label">port {fmt(stats['port_bound'] and stats['port_bound']['median'])}s · p90 {fmt(stats['first_response'] and stats['first_response']['p90'])}s</span>
+                <span class="stat-label">first req {fmt(stats['first_latency'] and stats['first_latency']['median'])}s</span>
+                <span class="stat-label">idle RSS {fmt_rate(stats['idle_rss'] and stats['idle_rss']['median'] / 2**20)} MB</span>
+            </div>"""
+        cards_html += f"""
+        <div class="card">
+            <h2>{COLD_START}</h2>
+            <canvas id="{COLD_START}Chart"></canvas>
+            <div class="stats-grid">
+                {items}
+            </div>
+            <canvas id="{COLD_START}Curve" style="margin-top: 20px;"></canvas>
+        </div>
+        """
+
+    # Problem-size scaling: median latency per (runtime, algorithm) against n
+    scaling = RESULTS.get(SCALING_ROUND, {})
+    if scaling:
+        columns = [(lang, algo) for lang, stats in scaling.items()
+                   for algo in dict.fromkeys(point["algo"] for point in stats["points"])]
+        header = "".join(f"<th>{lang} {algo}</th>" for lang, algo in columns)
+        rows = ""
+        for n in SCALING["ns"]:
+            cells = ""
+            for lang, algo in columns:
+                point = next((p for p in scaling[lang]["points"] if p["algo"] == algo and p["n"] == n), None)
+                cells += f"<td>{fmt(point['p50'])}s</td>" if point else "<td>–</td>"
+            rows += f"<tr><td class=\"stat-label\">{n:,}</td>{cells}</tr>"
+        warnings = "".join(f'<p class="stat-label" style="color: #ef4444">{lang}: algorithms disagree at n='
+                           f'{", ".join(map(str, stats["disagreements"]))}</p>'
+                           for lang, stats in scaling.items() if stats["disagreements"])
+        cards_html += f"""
+        <div class="card">
+            <h2>{SCALING_ROUND}</h2>
+            <canvas id="{SCALING_ROUND}Curve"></canvas>
+            <table class="stage-table">
+                <tr><th>n (median latency)</th>{header}</tr>
+                {rows}
+            </table>
+            {warnings}
         </div>
         """
 
@@ -186,12 +1711,16 @@ def generate_html():
         'Dotnet': '#512bd4',
         'Go': '#00ADD8',
         'Dotnet AOT': '#d946ef',
-        'Python': '#FFD43B'
+        'Python': '#FFD43B',
+        'Python (thread)': '#3776AB',
+        'Python (backend)': '#a16207',
+        'Python (workers)': '#0ea5e9'
     }
     
-    for test in RESULTS:
-        labels = [s[0] for s in SUTS]
+    for test in load_rounds:
+        labels = tested(test)
         data_vals = [RESULTS[test][lang]['avg'] for lang in labels]
+        goodput_vals = [RESULTS[test][lang]['goodput'] for lang in labels]
         bg_colors = [colors.get(l, '#ccc') for l in labels]
         
         scripts += f"""
@@ -201,16 +1730,25 @@ def generate_html():
                 labels: {str(labels)},
                 datasets: [{{
                     label: 'Avg Latency (s)',
-                    data: {str(data_vals)},
+                    data: {json.dumps(data_vals)},
                     backgroundColor: {str(bg_colors)},
                     borderRadius: 6,
-                    borderWidth: 0
+                    borderWidth: 0,
+                    yAxisID: 'y'
+                }}, {{
+                    label: 'Goodput (req/s)',
+                    data: {json.dumps(goodput_vals)},
+                    backgroundColor: {str([c + '66' for c in bg_colors])},
+                    borderColor: {str(bg_colors)},
+                    borderRadius: 6,
+                    borderWidth: 1,
+                    yAxisID: 'y1'
                 }}]
             }},
             options: {{
                 responsive: true,
                 plugins: {{
-                    legend: {{ display: false }},
+                    legend: {{ labels: {{ color: '#94a3b8', boxWidth: 12 }} }},
                     tooltip: {{
                         backgroundColor: '#1e293b',
                         padding: 12,
@@ -221,6 +1759,321 @@ def generate_html():
                 scales: {{
                     y: {{
                         beginAtZero: true,
+                        title: {{ display: true, text: 'avg latency (s)', color: '#94a3b8' }},
+                        grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    y1: {{
+                        beginAtZero: true,
+                        position: 'right',
+                        title: {{ display: true, text: 'goodput (req/s)', color: '#94a3b8' }},
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    x: {{
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }}
+                }}
+            }}
+        }});
+        """
+
+    # Per-interval timelines: p99 (solid, left axis) and throughput (dashed, right axis)
+    for test in load_rounds:
+        datasets = []
+        ticks = []
+        for lang in tested(test):
+            series = RESULTS[test][lang].get("timeline")
+            if series is None or not len(series):
+                continue
+            columns = series_to_columns(series)
+            if len(columns["t"]) > len(ticks):
+                ticks = columns["t"]
+            color = colors.get(lang, '#ccc')
+            datasets.append({"label": f"{lang} p99 (s)", "data": columns["p99"], "borderColor": color,
+                             "backgroundColor": color, "yAxisID": "y", "pointRadius": 0, "spanGaps": True})
+            datasets.append({"label": f"{lang} req/s", "data": columns["throughput"], "borderColor": color,
+                             "backgroundColor": color, "borderDash": [6, 4], "yAxisID": "y1", "pointRadius": 0})
+
+        scripts += f"""
+        new Chart(document.getElementById('{test}Timeline'), {{
+            type: 'line',
+            data: {{
+                labels: {json.dumps([f"{t:g}s" for t in ticks])},
+                datasets: {json.dumps(datasets)}
+            }},
+            options: {{
+                responsive: true,
+                interaction: {{ mode: 'index', intersect: false }},
+                plugins: {{
+                    legend: {{ labels: {{ color: '#94a3b8', boxWidth: 12 }} }},
+                    tooltip: {{ backgroundColor: '#1e293b', padding: 12 }}
+                }},
+                scales: {{
+                    y: {{
+                        beginAtZero: true,
+                        title: {{ display: true, text: 'p99 latency (s)', color: '#94a3b8' }},
+                        grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    y1: {{
+                        beginAtZero: true,
+                        position: 'right',
+                        title: {{ display: true, text: 'throughput (req/s)', color: '#94a3b8' }},
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    x: {{
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }}
+                }}
+            }}
+        }});
+        """
+
+    # SUT resources: CPU cores in use (solid, left axis) and RSS (dashed, right axis)
+    for test in load_rounds:
+        datasets = []
+        ticks = []
+        for lang in tested(test):
+            series = RESULTS[test][lang].get("resources")
+            if series is None:
+                continue
+            if len(series) > len(ticks):
+                ticks = series["t"].tolist()
+            color = colors.get(lang, '#ccc')
+            datasets.append({"label": f"{lang} CPU (cores)", "data": (series["cpu_user"] + series["cpu_sys"]).tolist(),
+                             "borderColor": color, "backgroundColor": color, "yAxisID": "y", "pointRadius": 0})
+            datasets.append({"label": f"{lang} RSS (MB)", "data": (series["rss"] / 2**20).tolist(),
+                             "borderColor": color, "backgroundColor": color, "borderDash": [6, 4],
+                             "yAxisID": "y1", "pointRadius": 0})
+        if not datasets:
+            continue
+
+        scripts += f"""
+        new Chart(document.getElementById('{test}Resources'), {{
+            type: 'line',
+            data: {{
+                labels: {json.dumps([f"{t:g}s" for t in ticks])},
+                datasets: {json.dumps(datasets)}
+            }},
+            options: {{
+                responsive: true,
+                interaction: {{ mode: 'index', intersect: false }},
+                plugins: {{
+                    legend: {{ labels: {{ color: '#94a3b8', boxWidth: 12 }} }},
+                    tooltip: {{ backgroundColor: '#1e293b', padding: 12 }}
+                }},
+                scales: {{
+                    y: {{
+                        beginAtZero: true,
+                        title: {{ display: true, text: 'SUT CPU (cores)', color: '#94a3b8' }},
+                        grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    y1: {{
+                        beginAtZero: true,
+                        position: 'right',
+                        title: {{ display: true, text: 'SUT RSS (MB)', color: '#94a3b8' }},
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    x: {{
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }}
+                }}
+            }}
+        }});
+        """
+
+    # Request phases: mean time per phase over each runtime's slowest 1%
+    phase_colors = {
+        'send_delay': '#f97316', 'pool_wait': '#ef4444', 'dns': '#a3a3a3', 'connect': '#facc15',
+        'request_sent': '#fb7185', 'first_byte': '#38bdf8', 'body': '#818cf8'
+    }
+    for test in load_rounds:
+        labels = [lang for lang in tested(test) if RESULTS[test][lang].get("tail_phases")]
+        if not labels:
+            continue
+        datasets = [{
+            "label": phase,
+            "data": [RESULTS[test][lang]["tail_phases"][phase] * 1000 for lang in labels],
+            "backgroundColor": phase_colors[phase],
+            "borderWidth": 0,
+        } for phase in PHASES]
+        scripts += f"""
+        new Chart(document.getElementById('{test}Phases'), {{
+            type: 'bar',
+            data: {{
+                labels: {json.dumps(labels)},
+                datasets: {json.dumps(datasets)}
+            }},
+            options: {{
+                indexAxis: 'y',
+                responsive: true,
+                plugins: {{
+                    title: {{ display: true, text: 'Where the p99 tail spends its time', color: '#94a3b8' }},
+                    legend: {{ labels: {{ color: '#94a3b8' }} }},
+                    tooltip: {{ backgroundColor: '#1e293b', padding: 12 }}
+                }},
+                scales: {{
+                    x: {{
+                        stacked: true,
+                        beginAtZero: true,
+                        title: {{ display: true, text: 'ms (mean over requests ≥ p99)', color: '#94a3b8' }},
+                        grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    y: {{
+                        stacked: true,
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }}
+                }}
+            }}
+        }});
+        """
+
+    # Efficiency ranking: requests per CPU-second, best first
+    for test in load_rounds:
+        ranking = efficiency_ranking(RESULTS[test])
+        if not ranking:
+            continue
+        labels = [lang for lang, _ in ranking]
+        bg_colors = [colors.get(l, '#ccc') for l in labels]
+        scripts += f"""
+        new Chart(document.getElementById('{test}Efficiency'), {{
+            type: 'bar',
+            data: {{
+                labels: {json.dumps(labels)},
+                datasets: [{{
+                    label: 'Requests per CPU-second',
+                    data: {json.dumps([eff['req_per_cpu_s'] for _, eff in ranking])},
+                    backgroundColor: {json.dumps(bg_colors)},
+                    borderRadius: 6,
+                    borderWidth: 0
+                }}]
+            }},
+            options: {{
+                indexAxis: 'y',
+                responsive: true,
+                plugins: {{
+                    legend: {{ display: false }},
+                    tooltip: {{ backgroundColor: '#1e293b', padding: 12 }}
+                }},
+                scales: {{
+                    x: {{
+                        beginAtZero: true,
+                        title: {{ display: true, text: 'requests per CPU-second', color: '#94a3b8' }},
+                        grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    y: {{
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }}
+                }}
+            }}
+        }});
+        """
+
+    # Trends: p99 (solid, left axis) and goodput (dashed, right axis) across stored runs
+    for test in load_rounds:
+        if not trends[test]:
+            continue
+        labels, values = trends[test]
+        datasets = []
+        for lang, _ in SUTS:
+            color = colors.get(lang, '#ccc')
+            if any(v is not None for v in values[(lang, "p99")]):
+                datasets.append({"label": f"{lang} p99 (s)", "data": values[(lang, "p99")], "borderColor": color,
+                                 "backgroundColor": color, "yAxisID": "y", "spanGaps": True})
+                datasets.append({"label": f"{lang} goodput", "data": values[(lang, "goodput")], "borderColor": color,
+                                 "backgroundColor": color, "borderDash": [6, 4], "yAxisID": "y1", "spanGaps": True})
+
+        scripts += f"""
+        new Chart(document.getElementById('{test}Trend'), {{
+            type: 'line',
+            data: {{
+                labels: {json.dumps(labels)},
+                datasets: {json.dumps(datasets)}
+            }},
+            options: {{
+                responsive: true,
+                interaction: {{ mode: 'index', intersect: false }},
+                plugins: {{
+                    title: {{ display: true, text: 'Last {len(labels)} runs', color: '#94a3b8' }},
+                    legend: {{ labels: {{ color: '#94a3b8', boxWidth: 12 }} }},
+                    tooltip: {{ backgroundColor: '#1e293b', padding: 12 }}
+                }},
+                scales: {{
+                    y: {{
+                        beginAtZero: true,
+                        title: {{ display: true, text: 'p99 latency (s)', color: '#94a3b8' }},
+                        grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    y1: {{
+                        beginAtZero: true,
+                        position: 'right',
+                        title: {{ display: true, text: 'goodput (req/s)', color: '#94a3b8' }},
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }},
+                    x: {{
+                        grid: {{ display: false }},
+                        ticks: {{ color: '#94a3b8' }}
+                    }}
+                }}
+            }}
+        }});
+        """
+
+    # Capacity curves: p99 against offered load (search) or achieved goodput (sweep)
+    for test in load_rounds:
+        if not any("curve" in RESULTS[test][lang] for lang in tested(test)):
+            continue
+        datasets = []
+        x_label = "offered load"
+        for lang in tested(test):
+            stats = RESULTS[test][lang]
+            if "curve" not in stats:
+                continue
+            x_key = stats["curve_x"]
+            if x_key == "goodput":
+                x_label = "goodput (req/s)"
+            else:
+                x_label = "virtual users" if stats["search_kind"] == "users" else "target req/s"
+            color = colors.get(lang, '#ccc')
+            datasets.append({"label": lang, "data": [{"x": p[x_key], "y": p["p99"]} for p in stats["curve"]],
+                             "borderColor": color, "backgroundColor": color, "showLine": True})
+        scripts += curve_chart(f"{test}Curve", datasets, x_label, "p99 latency (s)")
+
+    if cold_starts:
+        labels = list(cold_starts)
+        datasets = []
+        for key, title, alpha in (("port_bound", "port bound (s)", "66"), ("first_response", "first 200 (s)", "")):
+            datasets.append({"label": title,
+                             "data": [stats[key] and stats[key]["median"] for stats in cold_starts.values()],
+                             "backgroundColor": [colors.get(l, '#ccc') + alpha for l in labels],
+                             "borderRadius": 6})
+        scripts += f"""
+        new Chart(document.getElementById('{COLD_START}Chart'), {{
+            type: 'bar',
+            data: {{ labels: {json.dumps(labels)}, datasets: {json.dumps(datasets)} }},
+            options: {{
+                responsive: true,
+                plugins: {{
+                    legend: {{ labels: {{ color: '#94a3b8', boxWidth: 12 }} }},
+                    tooltip: {{ backgroundColor: '#1e293b', padding: 12 }}
+                }},
+                scales: {{
+                    y: {{
+                        beginAtZero: true,
+                        title: {{ display: true, text: 'median since launch (s)', color: '#94a3b8' }},
                         grid: {{ color: 'rgba(255, 255, 255, 0.1)' }},
                         ticks: {{ color: '#94a3b8' }}
                     }},
@@ -232,6 +2085,24 @@ def generate_html():
             }}
         }});
         """
+        datasets = []
+        for lang, stats in cold_starts.items():
+            color = colors.get(lang, '#ccc')
+            datasets.append({"label": lang, "data": [{"x": i + 1, "y": v} for i, v in enumerate(stats["curve"])],
+                             "borderColor": color, "backgroundColor": color, "showLine": True, "pointRadius": 0})
+        scripts += curve_chart(f"{COLD_START}Curve", datasets, "request # after ready", "median latency (s)")
+
+    if scaling:
+        dashes = {"naive": [], "sieve": [6, 4], "table": [2, 3]}
+        datasets = []
+        for lang, stats in scaling.items():
+            color = colors.get(lang, '#ccc')
+            for algo in dict.fromkeys(point["algo"] for point in stats["points"]):
+                datasets.append({"label": f"{lang} {algo}",
+                                 "data": [{"x": p["n"], "y": p["p50"]} for p in stats["points"] if p["algo"] == algo],
+                                 "borderColor": color, "backgroundColor": color, "showLine": True,
+                                 "borderDash": dashes.get(algo, [])})
+        scripts += curve_chart(f"{SCALING_ROUND}Curve", datasets, "n (nth prime)", "median latency (s)", log=True)
 
     html = f"""
 <!DOCTYPE html>
@@ -255,6 +2126,9 @@ def generate_html():
         .stat-label {{ color: var(--text-dim); font-size: 0.75rem; display: block; margin-bottom: 4px; }}
         .stat-val {{ font-weight: 600; }}
         canvas {{ max-height: 300px; }}
+        .stage-table {{ width: 100%; margin-top: 20px; border-collapse: collapse; font-size: 0.8rem; }}
+        .stage-table th, .stage-table td {{ padding: 6px; text-align: center; border-bottom: 1px solid rgba(255,255,255,0.05); }}
+        .stage-table th {{ color: var(--text-dim); font-weight: 600; }}
     </style>
 </head>
 <body>
@@ -275,25 +2149,126 @@ def generate_html():
     with open("results.html", "w") as f:
         f.write(html)
 
+# ================= RESULTS FILE =================
+
+def save_results():
+    with open(RESULTS_FILE, "w") as f:
+        json.dump(store.jsonable(RESULTS), f)
+
+def store_results():
+    # Settings that change what the numbers mean go into the run's fingerprint
+    settings = {
+        "manage_suts": MANAGE_SUTS,
+        "sut_cpus": sorted(SUT_CPUS) if SUT_CPUS else None,
+        "load_workers": LOAD_WORKERS,
+    }
+    return store.save_run(RESULTS, RESULTS_DB, settings)
+
 # ================= MAIN =================
 
-async def main():
-    await baseline_test()
-    await cool_down(5)
+ROUNDS = [
+    (baseline_test, 5),
+    (io_test, 10),
+    (cpu_test, 10),
+    (sustained_test, 10),
+    (open_loop_test, 10),
+    (profile_test, 10),
+    (breaking_point_test, 10),
+    (sweep_test, 10),
+    (trials_test, 10),
+    (scaling_test, 10),
+]
+
+async def run_rounds(suts=SUTS, rounds=ROUNDS):
+    for i, (test_round, pause) in enumerate(rounds):
+        await test_round(suts)
+        if i < len(rounds) - 1:
+            await cool_down(pause)
 
-    await io_test()
-    await cool_down(10)
+@asynccontextmanager
+async def managed_sut(name):
+    # Launch and stop the SUT around the block under MANAGE_SUTS; otherwise
+    # it is already running
+    if not MANAGE_SUTS:
+        yield
+        return
+    async with SutProcess(name) as process:
+        SUT_PIDS[name] = process.pid
+        try:
+            yield
+        finally:
+            del SUT_PIDS[name]
 
-    await cpu_test()
-    await cool_down(10)
+async def main():
+    if MANAGE_SUTS:
+        # One SUT at a time: launch it, run every round against it, stop it.
+        # Trials come last: they interleave runtimes, relaunching per run.
+        # A SUT that fails to build or start is skipped; the others still run
+        pin_load_generators()
+        built = build_all([name for name, _ in SUTS])
+        suts = [sut for sut in SUTS if sut[0] in built]
+        if COLD_START_REPEATS:
+            await cold_start_test(suts)
+            await cool_down(5)
+        per_sut = [r for r in ROUNDS if r[0] is not trials_test]
+        started = []
+        for sut in suts:
+            try:
+                async with managed_sut(sut[0]):
+                    await run_rounds([sut], per_sut)
+            except LAUNCH_ERRORS as e:
+                print(f"❌  {sut[0]} failed, skipping it: {e}")
+            else:
+                started.append(sut)
+            await cool_down(5)
+        if len(per_sut) < len(ROUNDS):
+            await trials_test(started)
+    else:
+        await run_rounds()
 
-    await sustained_test()
+    compare_trials()
 
     print("\n===== FINAL SUMMARY =====")
     for test, data in RESULTS.items():
         print(f"\n{test}")
         for runtime, stats in data.items():
-            print(f"  {runtime}: {stats}")
+            if test == COLD_START:
+                print(f"  {runtime}: {describe_cold_start(stats)}")
+                continue
+            if test == SCALING_ROUND:
+                print(f"  {runtime}: {describe_scaling(stats)}")
+                continue
+            workers = stats.get("workers", [])
+            print(f"  {runtime}: {describe(stats)}")
+            if "max_throughput_at_slo" in stats:
+                print(f"      max throughput at p99 ≤ {stats['p99_slo']}s: "
+                      f"{fmt_rate(stats['max_throughput_at_slo'])} req/s (knee at {stats['knee_rate']} req/s target)")
+            elif "max_sustainable" in stats:
+                print(f"      max sustainable {stats['search_kind']}: {stats['max_sustainable']} "
+                      f"(first failing: {stats['first_failing']}, {len(stats['curve'])} probes)")
+            if stats.get("phases") and stats["count"]:
+                print(f"      phases p99 (s): {describe_phases(stats)}")
+            if stats.get("efficiency"):
+                print(f"      efficiency: {describe_efficiency(stats['efficiency'])}")
+            if "trials" in stats:
+                print(f"      trials: {describe_trials(stats['trials'])}")
+                for other, versus in stats["trials"]["versus"].items():
+                    print(f"      vs {other}: {describe_versus(versus)}")
+            for stage, stage_stats in stats.get("stages", {}).items():
+                print(f"      [{stage} {stage_stats['start']:.0f}-{stage_stats['end']:.0f}s] {describe(stage_stats)}")
+            for i, w in enumerate(workers):
+                print(f"      worker {i}: {describe(w)}")
+
+        ranking = efficiency_ranking(data) if test not in (COLD_START, SCALING_ROUND) else []
+        if len(ranking) > 1:
+            print("  ranking (req per CPU-second): " + " > ".join(
+                f"{runtime} {fmt_rate(eff['req_per_cpu_s'])}" for runtime, eff in ranking))
+
+    save_results()
+    print(f"\n💾 Results saved → {RESULTS_FILE}")
+    if RESULTS_DB:
+        run_id = store_results()
+        print(f"🗄️  Run {run_id} stored → {RESULTS_DB}")
 
     generate_html()
     print("\n📄 HTML report generated → results.html")
@@ -0,0 +1,205 @@
+import asyncio
+import aiohttp
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+# Launches one system under test at a time, pinned to its own CPU set, and
+# waits until it answers before any round is measured against it.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.path.join(HERE, "sut-logs")
+
+def python_sut(port, io_mode):
+    # One FastAPI process per /io mode (see PythonTest/main.py)
+    return {
+        "cwd": "PythonTest",
+        "cmd": [sys.executable, "-m", "uvicorn", "main:app", "--host", "0.0.0.0", "--port", str(port)],
+        "env": {"PYTHON_IO_MODE": io_mode},
+        "port": port,
+    }
+
+# How to build (optional, run once) and start each SUT; paths are relative to
+# the SUT's cwd, which is relative to this directory. "env" is added to the
+# harness's environment.
+SUT_PROCESSES = {
+    "Node.js": {
+        "cwd": "NodeJstest",
+        "cmd": ["node", "index.js"],
+        "port": 3000,
+    },
+    "Dotnet": {
+        "cwd": "DotnetTest/DotnetTest",
+        "build": ["dotnet", "build", "-c", "Release"],
+        "cmd": ["dotnet", "bin/Release/net10.0/DotnetTest.dll"],
+        "port": 5500,
+    },
+    "Go": {
+        "cwd": "GoLangTEst",
+        "build": ["go", "build", "-o", "gotest", "."],
+        "cmd": ["./gotest"],
+        "port": 8080,
+    },
+    "Dotnet AOT": {
+        "cwd": "DotnetAot/DotnetAotTest",
+        "build": ["dotnet", "publish", "-c", "Release", "-r", "linux-x64"],
+        "cmd": ["bin/Release/net10.0/linux-x64/publish/DotnetAotTest"],
+        "port": 5600,
+    },
+    "Python": python_sut(8000, "async"),
+    "Python (thread)": python_sut(8001, "thread"),
+    "Python (backend)": python_sut(8002, "backend"),
+    # One pinned worker per core sharing the port via SO_REUSEPORT (PythonTest/serve.py)
+    "Python (workers)": {
+        "cwd": "PythonTest",
+        "cmd": [sys.executable, "serve.py", "--host", "0.0.0.0", "--port", "8003"],
+        "port": 8003,
+    },
+}
+
+SUT_CPUS = None         # CPU ids every SUT is pinned to, e.g. {0, 1, 2, 3} (None = no pinning)
+READY_PATH = "/io"      # endpoint polled until it answers 200
+READY_TIMEOUT = 120     # seconds to wait for a SUT to become ready
+POLL_INTERVAL = 0.01    # seconds between readiness probes
+STOP_TIMEOUT = 10       # seconds between SIGTERM and SIGKILL
+
+
+class SutNotReady(RuntimeError):
+    pass
+
+
+def port_open(port, host="127.0.0.1"):
+    with socket.socket() as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex((host, port)) == 0
+
+
+async def port_open_async(port, host="127.0.0.1"):
+    # port_open without blocking the event loop while the SUT starts up
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 0.2)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+class SutProcess:
+    """One launch of a SUT; use as `async with SutProcess(name) as sut:`."""
+
+    def __init__(self, name, cpus=None):
+        if name not in SUT_PROCESSES:
+            raise KeyError(f"No launch configuration for SUT {name!r}")
+        self.name = name
+        self.spec = SUT_PROCESSES[name]
+        self.cwd = os.path.join(HERE, self.spec["cwd"])
+        self.port = self.spec["port"]
+        self.cpus = set(cpus or SUT_CPUS or ()) or None
+        self.proc = None
+        self.log = None
+        self.launched_at = None
+        self.port_bound_at = None
+        self.ready_at = None
+        self.first_response_latency = None   # latency of the probe that first got a 200
+
+    def build(self):
+        if "build" in self.spec:
+            print(f"🔧  Building {self.name}: {' '.join(self.spec['build'])}")
+            subprocess.run(self.spec["build"], cwd=self.cwd, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+
+    def _pin(self):
+        # Runs in the child before exec, so every thread the runtime starts
+        # inherits the CPU set.
+        if self.cpus:
+            os.sched_setaffinity(0, self.cpus)
+
+    def start(self):
+        if port_open(self.port):
+            raise SutNotReady(f"Port {self.port} is already in use; stop the manually started {self.name} first")
+        os.makedirs(LOG_DIR, exist_ok=True)
+        self.log = open(os.path.join(LOG_DIR, f"{self.name.replace(' ', '_')}.log"), "ab")
+        self.launched_at = time.perf_counter()
+        self.proc = subprocess.Popen(
+            self.spec["cmd"], cwd=self.cwd, env={**os.environ, **self.spec.get("env", {})},
+            stdout=self.log, stderr=subprocess.STDOUT,
+            preexec_fn=self._pin, start_new_session=True,
+        )
+
+    async def wait_ready(self, timeout=READY_TIMEOUT):
+        """Poll until the port accepts connections and READY_PATH answers 200."""
+        url = f"http://127.0.0.1:{self.port}{READY_PATH}"
+        deadline = self.launched_at + timeout
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            while time.perf_counter() < deadline:
+                if self.proc.poll() is not None:
+                    raise SutNotReady(f"{self.name} exited with code {self.proc.returncode} (see {self.log.name})")
+                if self.port_bound_at is None:
+                    if await port_open_async(self.port):
+                        self.port_bound_at = time.perf_counter()
+                else:
+                    try:
+                        sent = time.perf_counter()
+                        async with session.get(url) as resp:
+                            await resp.read()
+                            if resp.status == 200:
+                                self.ready_at = time.perf_counter()
+                                self.first_response_latency = self.ready_at - sent
+                                return
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        pass
+                await asyncio.sleep(POLL_INTERVAL)
+        raise SutNotReady(f"{self.name} was not ready within {timeout}s")
+
+    def stop(self):
+        if self.proc is not None and self.proc.poll() is None:
+            # The SUT runs in its own session; signal the whole group so
+            # runtimes that fork helpers (dotnet, uvicorn workers) go down too.
+            os.killpg(self.proc.pid, signal.SIGTERM)
+            try:
+                self.proc.wait(STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                os.killpg(self.proc.pid, signal.SIGKILL)
+                self.proc.wait()
+        if self.log is not None:
+            self.log.close()
+
+    @property
+    def pid(self):
+        return self.proc.pid if self.proc else None
+
+    async def __aenter__(self):
+        try:
+            self.start()
+            await self.wait_ready()
+        except BaseException:
+            self.stop()
+            raise
+        print(f"🟢  {self.name} ready on port {self.port} "
+              f"({self.ready_at - self.launched_at:.2f}s, pid {self.pid}"
+              f"{', cpus ' + ','.join(map(str, sorted(self.cpus))) if self.cpus else ''})")
+        return self
+
+    async def __aexit__(self, *exc):
+        self.stop()
+        print(f"🔴  {self.name} stopped")
+
+
+def build_all(names):
+    """Build every SUT that has a build step; returns the names that built.
+
+    A SUT whose build fails (or whose toolchain is missing) is reported and
+    left out, so one broken runtime doesn't cancel the rest of the run.
+    """
+    built = []
+    for name in names:
+        try:
+            SutProcess(name).build()
+        except (subprocess.CalledProcessError, OSError) as e:
+            print(f"❌  {name} failed to build, skipping it: {e}")
+            continue
+        built.append(name)
+    return built
@@ -0,0 +1,75 @@
+import math
+import numpy as np
+from histogram import LatencyHistogram
+
+# Per-request phase timings, so a latency can be split into time spent in
+# the load generator and time spent waiting on the server.
+#
+# The phases add up to the request's measured latency:
+#   send_delay    intended send time -> aiohttp starts the request (client scheduling)
+#   pool_wait     queued for a free pooled connection
+#   dns           resolving the host (new connections only)
+#   connect       TCP connect (new connections only)
+#   request_sent  writing the request, plus any other client-side gaps
+#   first_byte    request written -> response headers received (server time + network)
+#   body          response headers -> body fully read
+
+PHASES = ("send_delay", "pool_wait", "dns", "connect", "request_sent", "first_byte", "body")
+SIDES = {
+    "client": ("send_delay", "pool_wait", "request_sent"),
+    "connection": ("dns", "connect"),
+    "server": ("first_byte", "body"),
+}
+
+# Coarse quarter-octave buckets of total latency, in microseconds, used to
+# find which requests are in the tail without keeping every request
+TAIL_BUCKETS = 4 * 32
+
+
+def tail_bucket(seconds):
+    us = max(seconds * 1e6, 1.0)
+    return min(TAIL_BUCKETS - 1, int(4 * math.log2(us)))
+
+
+class PhaseTimings:
+    def __init__(self):
+        # 1% precision is plenty for a breakdown and keeps seven histograms small
+        self.histograms = {phase: LatencyHistogram(significant_digits=2) for phase in PHASES}
+        self.connections = 0    # requests that opened a new connection
+        self.counts = np.zeros(TAIL_BUCKETS, dtype=np.int64)
+        self.sums = np.zeros((len(PHASES), TAIL_BUCKETS))
+
+    def record(self, total, phases, new_connection=False):
+        self.connections += new_connection
+        bucket = tail_bucket(total)
+        self.counts[bucket] += 1
+        for i, phase in enumerate(PHASES):
+            value = max(phases[phase], 0.0)
+            self.histograms[phase].record(value)
+            self.sums[i, bucket] += value
+
+    def merge(self, other):
+        for phase in PHASES:
+            self.histograms[phase].merge(other.histograms[phase])
+        self.connections += other.connections
+        self.counts += other.counts
+        self.sums += other.sums
+        return self
+
+    def tail(self, percentile=99):
+        """Mean time per phase over the requests at or beyond the percentile's bucket."""
+        total = self.counts.sum()
+        if not total:
+            return None
+        rank = percentile / 100 * total
+        start = int(np.searchsorted(np.cumsum(self.counts), rank))
+        count = self.counts[start:].sum()
+        return {phase: float(self.sums[i, start:].sum() / count) for i, phase in enumerate(PHASES)}
+
+
+def split_sides(phase_times):
+    # Fraction of the total spent on each side (client, connection, server)
+    total = sum(phase_times.values())
+    if not total:
+        return None
+    return {side: sum(phase_times[p] for p in phases) / total for side, phases in SIDES.items()}
@@ -0,0 +1,268 @@
+import numpy as np
+import os
+import threading
+import time
+
+# Readers for /proc accounting of a SUT process and everything it spawned,
+# and a background sampler that turns them into per-window usage.
+# Linux only; on other platforms the helpers return empty results.
+
+PROC = "/proc"
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+# Cumulative counters are differenced between samples; gauges are read as is
+COUNTERS = ("cpu_user", "cpu_sys", "ctx_voluntary", "ctx_involuntary", "read_bytes", "write_bytes")
+GAUGES = ("rss", "peak_rss", "threads", "fds")
+
+# Raw samples: monotonic time, counters summed over the process tree (including
+# processes that have since exited) and gauges summed over the live tree
+SAMPLE_DTYPE = np.dtype([("t", "f8")] + [(name, "f8") for name in COUNTERS + GAUGES])
+
+# Per-window usage, aligned with timeseries.SERIES_DTYPE windows
+RESOURCE_DTYPE = np.dtype([
+    ("t", "f8"),                # window start, seconds since the round started
+    ("cpu_user", "f8"),         # cores busy in user mode
+    ("cpu_sys", "f8"),          # cores busy in the kernel
+    ("ctx_voluntary", "f8"),    # context switches/s (blocking)
+    ("ctx_involuntary", "f8"),  # context switches/s (preempted)
+    ("read_bytes", "f8"),       # bytes/s through read syscalls, sockets included
+    ("write_bytes", "f8"),      # bytes/s through write syscalls, sockets included
+    ("rss", "f8"),              # bytes, highest sample in the window
+    ("peak_rss", "f8"),         # bytes, sum of each process's high-water mark
+    ("threads", "f8"),
+    ("fds", "f8"),
+])
+
+
+def children_map():
+    # ppid -> [pid] for every visible process
+    children = {}
+    try:
+        entries = os.listdir(PROC)
+    except FileNotFoundError:
+        return children
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"{PROC}/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm may contain spaces and parentheses; fields resume after the last ')'
+        ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def process_tree(pid):
+    """pid followed by all of its descendants."""
+    children = children_map()
+    tree = [pid]
+    for p in tree:
+        tree.extend(children.get(p, []))
+    return tree
+
+
+def read_status(pid):
+    status = {}
+    try:
+        with open(f"{PROC}/{pid}/status") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                status[key] = value.strip()
+    except OSError:
+        pass
+    return status
+
+
+def status_kb(status, key):
+    # "VmRSS:   12345 kB" -> bytes
+    value = status.get(key)
+    return int(value.split()[0]) * 1024 if value else 0
+
+
+def tree_rss(pid):
+    """Resident set size in bytes of pid and its descendants."""
+    return sum(status_kb(read_status(p), "VmRSS") for p in process_tree(pid))
+
+
+def pid_for_port(port):
+    """pid of the process listening on a local TCP port, or None if it can't be seen."""
+    inodes = set()
+    for table in ("tcp", "tcp6"):
+        try:
+            with open(f"{PROC}/net/{table}") as f:
+                next(f)
+                for line in f:
+                    fields = line.split()
+                    # local_address is "ADDR:PORT" in hex; state 0A is LISTEN
+                    if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        inodes.add(f"socket:[{fields[9]}]")
+        except OSError:
+            continue
+    if not inodes:
+        return None
+    owners = []
+    for entry in os.listdir(PROC):
+        if not entry.isdigit():
+            continue
+        try:
+            if any(os.readlink(f"{PROC}/{entry}/fd/{fd}") in inodes
+                   for fd in os.listdir(f"{PROC}/{entry}/fd")):
+                owners.append(int(entry))
+        except OSError:
+            # Exited, or owned by another user
+            continue
+    if not owners:
+        return None
+    # SO_REUSEPORT workers each open a socket of their own and the supervisor
+    # that forked them holds none; sample the supervisor so all are covered
+    parents = {int(read_status(pid).get("PPid", 0)) for pid in owners}
+    if len(owners) > 1 and len(parents) == 1 and parents.isdisjoint({0, 1}):
+        return parents.pop()
+    # Forked workers inherit the listening socket; the parent is the oldest
+    return min(owners)
+
+
+def read_io(pid):
+    io = {}
+    try:
+        with open(f"{PROC}/{pid}/io") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                io[key] = int(value)
+    except OSError:
+        # Needs ptrace access to the process; left at zero otherwise
+        pass
+    return io
+
+
+def read_process(pid):
+    """Counters and gauges of one process, or None if it has exited."""
+    try:
+        with open(f"{PROC}/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    status = read_status(pid)
+    io = read_io(pid)
+    try:
+        fds = len(os.listdir(f"{PROC}/{pid}/fd"))
+    except OSError:
+        fds = 0
+    return {
+        "cpu_user": int(fields[11]) / CLK_TCK,
+        "cpu_sys": int(fields[12]) / CLK_TCK,
+        "ctx_voluntary": int(status.get("voluntary_ctxt_switches", 0)),
+        "ctx_involuntary": int(status.get("nonvoluntary_ctxt_switches", 0)),
+        "read_bytes": io.get("rchar", 0),
+        "write_bytes": io.get("wchar", 0),
+        "rss": status_kb(status, "VmRSS"),
+        "peak_rss": status_kb(status, "VmHWM"),
+        "threads": int(fields[17]),
+        "fds": fds,
+    }
+
+
+class ResourceSampler:
+    """Samples a process tree on a background thread: `with ResourceSampler(pid):`.
+
+    A thread rather than a task, so sampling keeps its cadence while the
+    event loop is saturated by the load generator.
+    """
+
+    def __init__(self, pid, interval=0.25):
+        self.pid = pid
+        self.interval = interval
+        self.rows = []
+        self.last = {}                              # pid -> its most recent reading
+        self.gone = dict.fromkeys(COUNTERS, 0)      # final counters of exited processes
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        if self.pid is None:
+            return
+        now = time.monotonic()
+        current = {}
+        for pid in process_tree(self.pid):
+            reading = read_process(pid)
+            if reading is not None:
+                current[pid] = reading
+        if not current:
+            return
+        for pid, reading in self.last.items():
+            if pid not in current:
+                for name in COUNTERS:
+                    self.gone[name] += reading[name]
+        self.last = current
+        self.rows.append((now,)
+                         + tuple(self.gone[name] + sum(r[name] for r in current.values()) for name in COUNTERS)
+                         + tuple(sum(r[name] for r in current.values()) for name in GAUGES))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self.sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+    @property
+    def samples(self):
+        return np.array(self.rows, dtype=SAMPLE_DTYPE)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def resource_series(samples, epoch, duration, interval):
+    """RESOURCE_DTYPE rows for the windows [epoch + i*interval, ...) of a round.
+
+    Counters are interpolated at the window edges, so windows line up with the
+    latency time series whatever the sampling phase.
+    """
+    if len(samples) < 2 or not duration:
+        return None
+    n = max(1, int(np.ceil(duration / interval - 1e-9)))
+    edges = epoch + np.minimum(np.arange(n + 1) * interval, duration)
+    width = np.diff(edges)
+    series = np.zeros(n, dtype=RESOURCE_DTYPE)
+    series["t"] = edges[:-1] - epoch
+    for name in COUNTERS:
+        series[name] = np.diff(np.interp(edges, samples["t"], samples[name])) / width
+    window = np.searchsorted(edges, samples["t"], side="right") - 1
+    for name in GAUGES:
+        values = np.interp(edges[:-1] + width / 2, samples["t"], samples[name])
+        for i in range(n):
+            in_window = samples[name][window == i]
+            if len(in_window):
+                values[i] = in_window.max()
+        series[name] = values
+    return series
+
+
+def resource_usage(samples, start, end):
+    """Totals between two monotonic times: counter deltas and gauge maxima."""
+    if len(samples) < 2 or end <= start:
+        return None
+    usage = {name: float(np.diff(np.interp([start, end], samples["t"], samples[name]))[0])
+             for name in COUNTERS}
+    usage["cpu_cores"] = float((usage["cpu_user"] + usage["cpu_sys"]) / (end - start))
+    inside = samples[(samples["t"] >= start) & (samples["t"] <= end)]
+    if not len(inside):
+        inside = samples
+    for name in GAUGES:
+        usage[f"{name}_max"] = float(inside[name].max())
+    return usage
@@ -0,0 +1,294 @@
+import base64
+import hashlib
+import io
+import json
+import numpy as np
+import os
+import platform
+import sqlite3
+import subprocess
+import time
+import uuid
+import zlib
+from histogram import LatencyHistogram
+from timeseries import series_to_columns
+
+# Every run's results in a local SQLite database, so runs can be compared
+# and trended instead of being overwritten by the next results.html.
+#
+# One row per (run, round, SUT): headline metrics as indexed columns, the full
+# summary as JSON, and the latency histogram and time series as compact blobs.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Headline metrics kept as columns; the only names history() accepts
+METRICS = ("avg", "p50", "p95", "p99", "throughput", "goodput", "errors", "count",
+           "cpu_cores", "rss_max", "req_per_cpu_s")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    git_rev TEXT,
+    git_dirty INTEGER,
+    fingerprint TEXT NOT NULL,
+    environment TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    started_at REAL NOT NULL,
+    round TEXT NOT NULL,
+    sut TEXT NOT NULL,
+    avg REAL, p50 REAL, p95 REAL, p99 REAL,
+    throughput REAL, goodput REAL, errors INTEGER, count INTEGER,
+    cpu_cores REAL, rss_max REAL, req_per_cpu_s REAL,
+    summary TEXT NOT NULL,
+    histogram BLOB,
+    timeline BLOB,
+    resources BLOB,
+    PRIMARY KEY (run_id, round, sut)
+);
+CREATE TABLE IF NOT EXISTS baselines (
+    name TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    pinned_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_series ON results (sut, round, started_at);
+CREATE INDEX IF NOT EXISTS runs_by_fingerprint ON runs (fingerprint, started_at);
+"""
+
+
+# ---------- encoding ----------
+
+def jsonable(value):
+    """RESULTS in JSON form: arrays as columns, histograms as base64 blobs."""
+    if isinstance(value, np.ndarray):
+        return series_to_columns(value)
+    if isinstance(value, LatencyHistogram):
+        return base64.b64encode(value.to_bytes()).decode()
+    if isinstance(value, dict):
+        return {k: jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def pack_array(array):
+    if array is None:
+        return None
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return zlib.compress(buffer.getvalue())
+
+
+def unpack_array(blob):
+    if blob is None:
+        return None
+    return np.load(io.BytesIO(zlib.decompress(blob)), allow_pickle=False)
+
+
+# ---------- run metadata ----------
+
+def git_revision():
+    # (revision, dirty) of the harness checkout, or (None, None) outside git
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=HERE, capture_output=True, text=True,
+                              timeout=10, check=True).stdout.strip()
+    try:
+        return git("rev-parse", "HEAD"), bool(git("status", "--porcelain"))
+    except (OSError, subprocess.SubprocessError):
+        return None, None
+
+
+def tool_version(cmd):
+    try:
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return (out.stdout or out.stderr).strip().splitlines()[0] if out.returncode == 0 else None
+
+
+def cpu_model():
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return platform.processor() or None
+
+
+def environment(settings=None):
+    """What the numbers depend on besides the code: machine, OS and runtimes."""
+    env = {
+        "host": platform.node(),
+        "os": platform.platform(),
+        "cpu": cpu_model(),
+        "cores": os.cpu_count(),
+        "memory": os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") if hasattr(os, "sysconf") else None,
+        "python": platform.python_version(),
+        "node": tool_version(["node", "--version"]),
+        "dotnet": tool_version(["dotnet", "--version"]),
+        "go": tool_version(["go", "version"]),
+    }
+    env.update(settings or {})
+    return env
+
+
+def fingerprint(env):
+    # Stable across runs on the same setup; the host name is left out so a
+    # rebuilt machine with identical hardware and software still matches
+    stable = {k: v for k, v in env.items() if k != "host"}
+    return hashlib.sha1(json.dumps(stable, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+
+# ---------- writing ----------
+
+def connect(path):
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def save_run(results, path, settings=None):
+    """Store one run's RESULTS; returns its run id."""
+    started_at = time.time()
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(started_at))}-{uuid.uuid4().hex[:6]}"
+    git_rev, git_dirty = git_revision()
+    env = environment(settings)
+
+    rows = []
+    for test, data in results.items():
+        for sut, summary in data.items():
+            usage = summary.get("usage") or {}
+            eff = summary.get("efficiency") or {}
+            metrics = dict({m: summary.get(m) for m in METRICS},
+                           cpu_cores=usage.get("cpu_cores"), rss_max=usage.get("rss_max"),
+                           req_per_cpu_s=eff.get("req_per_cpu_s"))
+            lean = {k: v for k, v in summary.items() if k not in ("histogram", "timeline", "resources")}
+            hist = summary.get("histogram")
+            rows.append((run_id, started_at, test, sut, *(metrics[m] for m in METRICS),
+                         json.dumps(jsonable(lean)),
+                         hist.to_bytes() if hist is not None else None,
+                         pack_array(summary.get("timeline")),
+                         pack_array(summary.get("resources"))))
+
+    with connect(path) as db:
+        db.execute("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                   (run_id, started_at, git_rev, None if git_dirty is None else int(git_dirty),
+                    fingerprint(env), json.dumps(env, default=str)))
+        db.executemany(f"INSERT INTO results VALUES ({', '.join('?' * (8 + len(METRICS)))})", rows)
+    db.close()
+    return run_id
+
+
+# ---------- queries ----------
+
+def history(path, sut, test, metric="p99", limit=30, fingerprint=None, before=None):
+    """[(run_id, started_at, git_rev, value)] for the last `limit` runs, oldest first.
+
+    e.g. history("results.db", "Go", "IO", "p99") for Go's /io p99 over the last 30 runs.
+    fingerprint restricts to runs on the same setup, before to runs started earlier.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}; expected one of {', '.join(METRICS)}")
+    query = (f"SELECT x.run_id, x.started_at, r.git_rev, x.{metric} FROM results x "
+             "JOIN runs r ON r.run_id = x.run_id WHERE x.sut = ? AND x.round = ?")
+    params = [sut, test]
+    if fingerprint is not None:
+        query += " AND r.fingerprint = ?"
+        params.append(fingerprint)
+    if before is not None:
+        query += " AND x.started_at < ?"
+        params.append(before)
+    query += " ORDER BY x.started_at DESC LIMIT ?"
+    params.append(limit)
+    with connect(path) as db:
+        rows = db.execute(query, params).fetchall()
+    db.close()
+    return rows[::-1]
+
+
+def recent_runs(path, limit=30):
+    """[(run_id, started_at, git_rev, fingerprint)] of the last `limit` runs, oldest first."""
+    with connect(path) as db:
+        rows = db.execute("SELECT run_id, started_at, git_rev, fingerprint FROM runs "
+                          "ORDER BY started_at DESC LIMIT ?", (limit,)).fetchall()
+    db.close()
+    return rows[::-1]
+
+
+def decode_result(row):
+    summary, histogram, timeline, resources = row
+    summary = json.loads(summary)
+    summary["histogram"] = LatencyHistogram.from_bytes(histogram) if histogram is not None else None
+    summary["timeline"] = unpack_array(timeline)
+    summary["resources"] = unpack_array(resources)
+    return summary
+
+
+def load_result(path, run_id, test, sut):
+    """Summary of one (run, round, SUT) with its histogram and series decoded, or None."""
+    with connect(path) as db:
+        row = db.execute("SELECT summary, histogram, timeline, resources FROM results "
+                         "WHERE run_id = ? AND round = ? AND sut = ?", (run_id, test, sut)).fetchone()
+    db.close()
+    return decode_result(row) if row is not None else None
+
+
+def load_run(path, run_id):
+    """{round: {sut: summary}} of a stored run, in the shape RESULTS had."""
+    results = {}
+    with connect(path) as db:
+        rows = db.execute("SELECT round, sut, summary, histogram, timeline, resources FROM results "
+                          "WHERE run_id = ? ORDER BY rowid", (run_id,)).fetchall()
+    db.close()
+    for test, sut, *blobs in rows:
+        results.setdefault(test, {})[sut] = decode_result(blobs)
+    return results
+
+
+def run_info(path, run_id):
+    with connect(path) as db:
+        row = db.execute("SELECT run_id, started_at, git_rev, git_dirty, fingerprint, environment "
+                         "FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    db.close()
+    if row is None:
+        return None
+    keys = ("run_id", "started_at", "git_rev", "git_dirty", "fingerprint", "environment")
+    info = dict(zip(keys, row))
+    info["environment"] = json.loads(info["environment"])
+    return info
+
+
+def load_results_file(path):
+    """RESULTS from a results.json written by load_test.save_results."""
+    with open(path) as f:
+        results = json.load(f)
+
+    def decode(summary):
+        if isinstance(summary.get("histogram"), str):
+            summary["histogram"] = LatencyHistogram.from_bytes(base64.b64decode(summary["histogram"]))
+        for stage in summary.get("stages", {}).values():
+            decode(stage)
+        return summary
+
+    return {test: {sut: decode(summary) for sut, summary in data.items()} for test, data in results.items()}
+
+
+def pin_baseline(path, run_id, name="default"):
+    if run_info(path, run_id) is None:
+        raise KeyError(f"No stored run {run_id!r} in {path}")
+    with connect(path) as db:
+        db.execute("INSERT OR REPLACE INTO baselines VALUES (?, ?, ?)", (name, run_id, time.time()))
+    db.close()
+
+
+def baseline_run(path, name="default"):
+    with connect(path) as db:
+        row = db.execute("SELECT run_id FROM baselines WHERE name = ?", (name,)).fetchone()
+    db.close()
+    return row[0] if row else None
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The harness modules import each other as top-level scripts (see
+# load_test.py), and the Python SUT lives in PythonTest/main.py
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(HERE), os.path.join(os.path.dirname(HERE), "PythonTest")]
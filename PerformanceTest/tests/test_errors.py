@@ -0,0 +1,55 @@
+import asyncio
+import errno
+
+import aiohttp
+import pytest
+
+from errors import ERROR_CLASSES, classify_exception, classify_status
+
+
+@pytest.mark.parametrize("status, kind", [
+    (429, "http_429"), (500, "http_5xx"), (503, "http_5xx"),
+    (404, "http_4xx"), (400, "http_4xx"), (302, "http_other"), (101, "http_other"),
+])
+def test_classify_status(status, kind):
+    assert classify_status(status) == kind
+
+
+def wrapped(inner):
+    # How client libraries surface OS errors: their own exception, raised from it
+    try:
+        try:
+            raise inner
+        except OSError as e:
+            raise RuntimeError("request failed") from e
+    except RuntimeError as e:
+        return e
+
+
+@pytest.mark.parametrize("exc, kind", [
+    (ConnectionRefusedError(), "connect_refused"),
+    (OSError(errno.ECONNREFUSED, "refused"), "connect_refused"),
+    (wrapped(ConnectionRefusedError()), "connect_refused"),
+    (ConnectionResetError(), "reset"),
+    (OSError(errno.EPIPE, "broken pipe"), "reset"),
+    (wrapped(ConnectionResetError()), "reset"),
+    (aiohttp.ServerDisconnectedError(), "reset"),
+    (aiohttp.ConnectionTimeoutError(), "connect_timeout"),
+    (aiohttp.SocketTimeoutError(), "read_timeout"),
+    (ValueError("bad"), "other"),
+])
+def test_classify_exception(exc, kind):
+    assert classify_exception(exc) == kind
+
+
+def test_timeouts_by_request_phase():
+    # Still waiting for a pooled connection, not yet sent, or sent
+    assert classify_exception(asyncio.TimeoutError(), sent=None, queued=True) == "pool_timeout"
+    assert classify_exception(asyncio.TimeoutError(), sent=None) == "connect_timeout"
+    assert classify_exception(asyncio.TimeoutError(), sent=1.0) == "read_timeout"
+
+
+def test_every_class_is_in_the_taxonomy():
+    kinds = {classify_status(s) for s in (101, 302, 404, 429, 503)}
+    kinds |= {classify_exception(e) for e in (ConnectionRefusedError(), ConnectionResetError(), ValueError())}
+    assert kinds <= set(ERROR_CLASSES)
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from histogram import LatencyHistogram
+
+PERCENTILES = (0.1, 1, 10, 25, 50, 75, 90, 99, 99.9, 100)
+
+
+def latencies_us(n=100_000, seed=1):
+    # Long-tailed, like real request latencies: median 5ms, tail into seconds
+    rng = np.random.default_rng(seed)
+    return rng.lognormal(np.log(5000), 1.0, n).astype(np.int64) + 1
+
+
+def histogram_of(values, **kwargs):
+    hist = LatencyHistogram(**kwargs)
+    for value in values:
+        hist.record_value(int(value))
+    return hist
+
+
+@pytest.mark.parametrize("digits", [2, 3])
+def test_percentiles_within_significant_digits(digits):
+    data = latencies_us()
+    hist = histogram_of(data, significant_digits=digits)
+    for p in PERCENTILES:
+        # closest_observation is numpy's nearest-rank percentile, the same
+        # definition value_at_percentile uses
+        expected = np.percentile(data, p, method="closest_observation")
+        assert abs(hist.value_at_percentile(p) - expected) / expected <= 10 ** -digits, p
+
+
+def test_percentile_is_in_seconds():
+    hist = LatencyHistogram()
+    for seconds in (0.010, 0.020, 0.030):
+        hist.record(seconds)
+    assert hist.percentile(50) == pytest.approx(0.020, rel=1e-3)
+    assert hist.mean() == pytest.approx(0.020)
+    assert (hist.min(), hist.max()) == (pytest.approx(0.010), pytest.approx(0.030))
+
+
+def test_empty_histogram():
+    hist = LatencyHistogram()
+    assert len(hist) == 0
+    assert hist.percentile(99) is None
+    assert hist.mean() is None
+
+
+def test_values_above_highest_are_clamped():
+    hist = LatencyHistogram(highest=1)
+    hist.record(5)
+    assert hist.max() == pytest.approx(1)
+
+
+def assert_same(a, b):
+    assert np.array_equal(a.counts, b.counts)
+    assert (a.total_count, a.total, a.min_value, a.max_value) == (b.total_count, b.total, b.min_value, b.max_value)
+    for p in PERCENTILES:
+        assert a.value_at_percentile(p) == b.value_at_percentile(p)
+
+
+def test_merge_equals_recording_the_combined_data():
+    data = latencies_us()
+    merged = histogram_of(data[:30_000])
+    merged.merge(histogram_of(data[30_000:]))
+    assert_same(merged, histogram_of(data))
+
+
+def test_merge_grows_to_the_larger_range():
+    data = latencies_us()
+    merged = histogram_of(data[:10], highest=1)
+    merged.merge(histogram_of(data[10:], highest=3600))
+    assert_same(merged, histogram_of(data, highest=3600))
+
+
+def test_merge_into_empty():
+    data = latencies_us(1000)
+    assert_same(LatencyHistogram().merge(histogram_of(data)), histogram_of(data))
+
+
+def test_merge_rejects_different_precision():
+    with pytest.raises(ValueError):
+        LatencyHistogram(significant_digits=2).merge(LatencyHistogram(significant_digits=3))
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"significant_digits": 2}, {"unit": "ns", "highest": 10}])
+def test_bytes_round_trip(kwargs):
+    hist = histogram_of(latencies_us(10_000), **kwargs)
+    restored = LatencyHistogram.from_bytes(hist.to_bytes())
+    assert (restored.unit, restored.significant_digits) == (hist.unit, hist.significant_digits)
+    assert restored.highest_trackable == hist.highest_trackable
+    assert_same(restored, hist)
+
+
+def test_bytes_round_trip_empty():
+    restored = LatencyHistogram.from_bytes(LatencyHistogram().to_bytes())
+    assert len(restored) == 0
+    assert restored.min_value is None
+
+
+def test_from_bytes_rejects_other_data():
+    with pytest.raises(ValueError):
+        LatencyHistogram.from_bytes(b"\0" * 64)
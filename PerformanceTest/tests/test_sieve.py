@@ -0,0 +1,47 @@
+import pytest
+
+import main
+
+
+def trial_division_primes(count):
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+PRIMES = trial_division_primes(2000)
+
+
+@pytest.fixture(params=[None, 64], ids=["default-segment", "small-segments"])
+def segment(request, monkeypatch):
+    # Small segments make even small n cross many segment boundaries
+    if request.param:
+        monkeypatch.setattr(main, "SIEVE_SEGMENT", request.param)
+
+
+def test_nth_prime_matches_trial_division(segment):
+    for n in list(range(1, 200)) + [500, 1000, 1999, 2000]:
+        assert main.get_nth_prime_sieve(n) == PRIMES[n - 1], n
+
+
+def test_first_primes_matches_trial_division(segment):
+    for count in (1, 2, 5, 6, 100, 2000):
+        assert main.first_primes(count).tolist() == PRIMES[:count]
+
+
+def test_primes_up_to_matches_trial_division():
+    for limit in range(0, 300):
+        assert main.primes_up_to(limit).tolist() == [p for p in PRIMES if p <= limit], limit
+
+
+def test_upper_bound_is_above_the_nth_prime():
+    for n in range(1, 2001):
+        assert main.nth_prime_upper_bound(n) >= PRIMES[n - 1], n
+
+
+def test_naive_engine_agrees():
+    assert [main.get_nth_prime(n) for n in range(1, 300)] == PRIMES[:299]
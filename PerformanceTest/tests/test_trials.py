@@ -0,0 +1,44 @@
+import numpy as np
+
+from trials import bootstrap_ci, permutation_test, relative_half_width
+
+
+def rng():
+    return np.random.default_rng(7)
+
+
+def test_bootstrap_ci_needs_two_values():
+    assert bootstrap_ci([1.0]) is None
+    assert bootstrap_ci([]) is None
+
+
+def test_bootstrap_ci_brackets_the_mean():
+    values = [98.0, 101.0, 100.0, 103.0, 99.0, 102.0]
+    low, high = bootstrap_ci(values, 0.95, rng=rng())
+    assert low < np.mean(values) < high
+    assert 98.0 <= low and high <= 103.0
+
+
+def test_bootstrap_ci_is_a_point_for_constant_values():
+    assert bootstrap_ci([5.0, 5.0, 5.0], rng=rng()) == (5.0, 5.0)
+
+
+def test_relative_half_width():
+    assert relative_half_width([9.0, 11.0], (9.0, 11.0)) == 0.1
+    assert relative_half_width([1.0], None) == float("inf")
+    assert relative_half_width([0.0, 0.0], (0.0, 0.0)) == float("inf")
+
+
+def test_permutation_test_needs_two_values_each():
+    assert permutation_test([1.0], [1.0, 2.0]) is None
+
+
+def test_permutation_test_separates_different_means():
+    # Fully separated groups of 5: only the 2 extreme splits of 252 are as far apart
+    p = permutation_test([1, 2, 3, 4, 5], [101, 102, 103, 104, 105], rng=rng())
+    assert p < 0.02
+
+
+def test_permutation_test_same_distribution():
+    p = permutation_test([1, 3, 5, 7, 9], [2, 4, 6, 8, 10], rng=rng())
+    assert p > 0.5
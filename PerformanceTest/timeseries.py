@@ -0,0 +1,85 @@
+import numpy as np
+from errors import ERROR_CLASSES
+from histogram import LatencyHistogram
+
+# Per-interval metrics for a round, bucketed by completion time.
+#
+# Each window keeps its own small histogram so windows from several
+# load-generator processes can be merged before percentiles are taken.
+
+SERIES_DTYPE = np.dtype([
+    ("t", "f8"),            # window start, seconds since the round started
+    ("count", "i8"),        # successful responses completed in the window
+    ("throughput", "f8"),   # successful responses/s
+    ("errors", "i8"),
+    ("p50", "f8"),
+    ("p90", "f8"),
+    ("p99", "f8"),
+    ("max", "f8"),
+] + [(f"errors_{kind}", "i8") for kind in ERROR_CLASSES])  # errors split by class
+
+WINDOW_DIGITS = 2  # per-window histograms trade precision for size
+
+
+class IntervalRecorder:
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.epoch = None
+        self.windows = []
+        self.errors = []
+
+    def start(self, now):
+        self.epoch = now
+
+    def _window(self, now):
+        index = max(0, int((now - self.epoch) / self.interval))
+        while len(self.windows) <= index:
+            self.windows.append(LatencyHistogram(significant_digits=WINDOW_DIGITS))
+            self.errors.append(np.zeros(len(ERROR_CLASSES), dtype=np.int64))
+        return index
+
+    def record(self, now, latency):
+        self.windows[self._window(now)].record(latency)
+
+    def error(self, now, kind="other"):
+        self.errors[self._window(now)][ERROR_CLASSES.index(kind)] += 1
+
+    def merge(self, other):
+        # Workers start on a shared schedule, so window i covers the same
+        # period in every process.
+        while len(self.windows) < len(other.windows):
+            self.windows.append(LatencyHistogram(significant_digits=WINDOW_DIGITS))
+            self.errors.append(np.zeros(len(ERROR_CLASSES), dtype=np.int64))
+        for i, window in enumerate(other.windows):
+            self.windows[i].merge(window)
+            self.errors[i] += other.errors[i]
+        return self
+
+    def to_array(self, duration=None):
+        """One SERIES_DTYPE row per window; percentiles are NaN for empty windows."""
+        series = np.zeros(len(self.windows), dtype=SERIES_DTYPE)
+        for i, window in enumerate(self.windows):
+            t = i * self.interval
+            width = self.interval
+            if duration is not None and duration - t > 0:
+                width = min(width, duration - t)
+            row = series[i]
+            row["t"] = t
+            row["count"] = len(window)
+            row["throughput"] = len(window) / width
+            row["errors"] = self.errors[i].sum()
+            for kind, count in zip(ERROR_CLASSES, self.errors[i]):
+                row[f"errors_{kind}"] = count
+            for field, q in (("p50", 50), ("p90", 90), ("p99", 99)):
+                value = window.percentile(q)
+                row[field] = np.nan if value is None else value
+            row["max"] = np.nan if not window else window.max()
+        return series
+
+
+def series_to_columns(series):
+    # JSON-friendly form of a SERIES_DTYPE array (NaN becomes None)
+    return {
+        name: [None if v != v else v for v in series[name].tolist()]
+        for name in series.dtype.names
+    }
@@ -0,0 +1,43 @@
+import numpy as np
+
+# Statistics over repeated trials of one (round, SUT) pair.
+#
+# Each trial contributes a single value per metric (its goodput, its p99, ...),
+# so the intervals describe run-to-run noise rather than request-to-request
+# spread within one run.
+
+RESAMPLES = 10000
+
+
+def bootstrap_ci(values, confidence=0.95, resamples=RESAMPLES, rng=None):
+    """Percentile-bootstrap interval for the mean of values."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return None
+    rng = rng or np.random.default_rng()
+    means = values[rng.integers(0, len(values), (resamples, len(values)))].mean(axis=1)
+    alpha = (1 - confidence) / 2
+    return float(np.quantile(means, alpha)), float(np.quantile(means, 1 - alpha))
+
+
+def relative_half_width(values, ci):
+    # Half the interval as a fraction of the mean; inf when it can't be judged
+    mean = float(np.mean(values)) if len(values) else 0.0
+    if ci is None or not mean:
+        return float("inf")
+    return (ci[1] - ci[0]) / 2 / abs(mean)
+
+
+def permutation_test(a, b, resamples=RESAMPLES, rng=None):
+    """Two-sided p-value for a difference in means between two sets of trials."""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if len(a) < 2 or len(b) < 2:
+        return None
+    rng = rng or np.random.default_rng()
+    observed = abs(a.mean() - b.mean())
+    pooled = np.tile(np.concatenate([a, b]), (resamples, 1))
+    shuffled = rng.permuted(pooled, axis=1)
+    diffs = np.abs(shuffled[:, :len(a)].mean(axis=1) - shuffled[:, len(a):].mean(axis=1))
+    # Count the observed split itself so p is never exactly zero
+    return float((np.sum(diffs >= observed - 1e-12) + 1) / (resamples + 1))
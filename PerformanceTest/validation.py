@@ -0,0 +1,56 @@
+import json
+
+# Response validators. The SUTs agree on values but not on key casing
+# (Node: "result", Go/.NET/Python: "Result", .NET's serializer: "result"), so
+# keys are normalized before anything is compared.
+#
+# A validator's check(body) returns None for a correct response or a short
+# reason string for a wrong one; the reason is what gets counted.
+
+
+def normalize_key(key):
+    # "Result", "result", "duration_ms" and "durationMs" all compare equal
+    return key.replace("_", "").replace("-", "").lower()
+
+
+def normalize_keys(value):
+    if isinstance(value, dict):
+        return {normalize_key(k): normalize_keys(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [normalize_keys(v) for v in value]
+    return value
+
+
+class Validator:
+    def check(self, body):
+        raise NotImplementedError
+
+
+class JsonFields(Validator):
+    """JSON object with expected values and/or value types for some keys.
+
+    JsonFields(expect={"result": 224737}, types={"message": str})
+    """
+
+    def __init__(self, expect=None, types=None):
+        self.expect = {normalize_key(k): v for k, v in (expect or {}).items()}
+        self.types = {normalize_key(k): t for k, t in (types or {}).items()}
+
+    def check(self, body):
+        try:
+            data = normalize_keys(json.loads(body))
+        except (ValueError, UnicodeDecodeError):
+            return "invalid JSON"
+        if not isinstance(data, dict):
+            return "not a JSON object"
+        for key, expected in self.expect.items():
+            if key not in data:
+                return f"missing {key}"
+            if data[key] != expected:
+                return f"{key} != {expected!r}"
+        for key, kind in self.types.items():
+            if key not in data:
+                return f"missing {key}"
+            if not isinstance(data[key], kind):
+                return f"{key} is not {kind.__name__}"
+        return None